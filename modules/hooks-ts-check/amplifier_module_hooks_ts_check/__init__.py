@@ -4,16 +4,49 @@ This hook triggers on file write/edit events and runs TS/JS quality
 checks, injecting feedback into the agent's context when issues are found.
 """
 
+import asyncio
 import fnmatch
+import functools
+import itertools
+import os.path
+import re
 from pathlib import Path
 from typing import Any
 
 from amplifier_core import HookResult
 
 from ._core import CheckConfig
+from ._core import CheckResult
 from ._core import Severity
-from ._core import check_files
-from ._core import load_config
+from ._core import TypeScriptChecker
+from ._core import _mtime_ns
+from ._core import find_project_root
+
+
+def _is_extension_pattern(pattern: str) -> bool:
+    """Check if pattern is a plain single-extension glob like "*.ts"."""
+    ext = pattern[2:]
+    return pattern.startswith("*.") and bool(ext) and not any(c in ext for c in "/*?[.")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_file_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[frozenset[str], tuple[str, ...], re.Pattern[str] | None, tuple[str, ...] | None]:
+    """Split file patterns into plain extensions and the rest, compiled into a single regex.
+
+    Also returns the literal suffixes that any matching path must end with,
+    or None when some pattern ends in a wildcard. Shared by every hook
+    instance configured with the same patterns.
+    """
+    extensions = frozenset(p[1:] for p in patterns if _is_extension_pattern(p))
+    complex_patterns = tuple(p for p in patterns if not _is_extension_pattern(p))
+    pattern_re = (
+        re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in complex_patterns)) if complex_patterns else None
+    )
+    tails = [re.split(r"[*?\[\]]", p)[-1] for p in patterns]
+    required_suffixes = None if not all(tails) else tuple(tails)
+    return extensions, complex_patterns, pattern_re, required_suffixes
 
 
 class TsCheckHooks:
@@ -24,6 +57,22 @@ class TsCheckHooks:
     JS_EXTENSIONS = {".js", ".jsx", ".mjs", ".cjs"}
     ALL_EXTENSIONS = TS_EXTENSIONS | JS_EXTENSIONS
 
+    # Shared result for events that need no action; treated as immutable
+    _CONTINUE = HookResult(action="continue")
+
+    # Tools that write or edit files, mapped to how each one names the target file
+    _PATH_EXTRACTORS = {
+        "write_file": lambda tool_input: tool_input.get("file_path") or tool_input.get("path"),
+        "edit_file": lambda tool_input: tool_input.get("file_path") or tool_input.get("path"),
+        "Write": lambda tool_input: tool_input.get("file_path"),
+        "Edit": lambda tool_input: tool_input.get("file_path"),
+        "MultiEdit": lambda tool_input: tool_input.get("file_path"),
+    }
+
+    # Edits arriving within this window (seconds) are checked together in one run
+    BATCH_WINDOW = 0.05
+    BATCH_MAX_FILES = 50
+
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize hooks with configuration.
 
@@ -34,15 +83,38 @@ class TsCheckHooks:
                 - report_level: str (default: "warning") - minimum level to report
                 - auto_inject: bool (default: True) - inject issues into context
                 - checks: list[str] (default: all) - which checks to run
+                - persistent: bool (default: False) - keep tsc running in watch mode between checks
+                  (until close() is called or the process exits)
+                - result_cache: bool (default: False) - reuse ESLint/Prettier results for unchanged files
         """
         config = config or {}
         self.enabled = config.get("enabled", True)
-        self.file_patterns = config.get(
-            "file_patterns", ["*.ts", "*.tsx", "*.js", "*.jsx", "*.mts", "*.mjs", "*.cts", "*.cjs"]
+        self.file_patterns = tuple(
+            config.get("file_patterns", ("*.ts", "*.tsx", "*.js", "*.jsx", "*.mts", "*.mjs", "*.cts", "*.cjs"))
         )
         self.report_level = config.get("report_level", "warning")
         self.auto_inject = config.get("auto_inject", True)
         self.checks = config.get("checks", ["eslint", "prettier", "tsc", "stubs"])
+        self.persistent = config.get("persistent", False)
+        self.result_cache = config.get("result_cache", False)
+
+        # Severities at or above the report level (unknown levels fall back to "warning")
+        min_severity = Severity.__members__.get(self.report_level.upper(), Severity.WARNING)
+        self._report_severities = tuple(severity for severity in Severity if severity <= min_severity)
+
+        # Plain extension patterns ("*.ts") become a set; only the rest need regex matching
+        self._ext_set, self._complex_patterns, self._pattern_re, required_suffixes = _compile_file_patterns(
+            self.file_patterns
+        )
+
+        # Suffixes a path must end with to possibly match; lets unrelated files (.py, .md, ...)
+        # skip pattern matching and stay out of the match cache
+        self._candidate_suffixes = (
+            tuple(dict.fromkeys((*self.ALL_EXTENSIONS, *required_suffixes))) if required_suffixes is not None else None
+        )
+
+        # Memoize match results per path; the same files are edited over and over in a session
+        self._match_cache = functools.lru_cache(maxsize=4096)(self._match_path)
 
         # Build check config
         self.check_config = CheckConfig(
@@ -50,30 +122,129 @@ class TsCheckHooks:
             enable_prettier="prettier" in self.checks,
             enable_tsc="tsc" in self.checks,
             enable_stub_check="stubs" in self.checks,
+            persistent=self.persistent,
+            result_cache=self.result_cache,
         )
 
+        # Checker reused across flushes, so per-project state (tool caches, executables, the tsc
+        # watcher) carries over; rebuilt when the project root or its package.json changes
+        self._checker: TypeScriptChecker | None = None
+        self._checker_key: tuple[Path | None, int | None] | None = None
+
+        # Files waiting for the next batched check, each with the future its caller awaits
+        self._pending: dict[str, asyncio.Future[CheckResult]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        # Flushes started because the batch filled up; held so they are not garbage collected
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        # One check run at a time; files arriving meanwhile wait for the next flush
+        self._flush_lock = asyncio.Lock()
+
+    def close(self) -> None:
+        """Stop the tsc watch process kept alive in persistent mode, if any."""
+        if self._checker is not None:
+            self._checker.close()
+
+    def _current_checker(self) -> TypeScriptChecker:
+        """Checker for the current project root, rebuilt when the root or its package.json changes."""
+        project_root = find_project_root()
+        key = (project_root, _mtime_ns(project_root / "package.json") if project_root else None)
+        if self._checker is None or key != self._checker_key:
+            self.close()
+            self._checker = TypeScriptChecker(self.check_config)
+            self._checker_key = key
+        return self._checker
+
     def _matches_patterns(self, file_path: str) -> bool:
         """Check if file path matches any configured pattern."""
-        path = Path(file_path)
+        return self._match_cache(file_path)
+
+    def _match_path(self, file_path: str) -> bool:
+        """Match a file path against extensions and patterns (uncached)."""
+        # "./src/x.vue" and "src//x.vue" must match "src/*.vue" like "src/x.vue" does
+        file_path = os.path.normpath(file_path)
+        ext = os.path.splitext(file_path)[1]
 
         # Check extension directly
-        if path.suffix in self.ALL_EXTENSIONS:
+        if ext in self.ALL_EXTENSIONS or ext in self._ext_set:
             return True
 
-        # Check patterns
-        for pattern in self.file_patterns:
-            if fnmatch.fnmatch(path.name, pattern):
-                return True
-            if fnmatch.fnmatch(str(path), pattern):
-                return True
-        return False
+        # Check remaining patterns
+        if self._pattern_re is None:
+            return False
+        return bool(self._pattern_re.match(os.path.basename(file_path)) or self._pattern_re.match(file_path))
 
-    def _filter_by_level(self, issues: list) -> list:
+    def _filter_by_level(self, result: CheckResult) -> list:
         """Filter issues by configured report level."""
-        level_order = {"error": 0, "warning": 1, "info": 2}
-        min_level = level_order.get(self.report_level, 1)
+        by_severity = result.issues_by_severity
+
+        return list(itertools.chain.from_iterable(by_severity[severity] for severity in self._report_severities))
 
-        return [i for i in issues if level_order.get(i.severity.value, 0) <= min_level]
+    async def _check_batched(self, file_path: str) -> CheckResult:
+        """Queue a file for the next batched check and wait for its share of the result.
+
+        Tool startup dominates each check run, so edits arriving close together
+        are coalesced into a single check_files call.
+        """
+        future = self._pending.get(file_path)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[file_path] = future
+
+        if len(self._pending) >= self.BATCH_MAX_FILES:
+            # Flush in its own task, so cancelling this caller cannot strand the rest of the batch
+            task = asyncio.create_task(self._flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(self.BATCH_WINDOW))
+
+        # Shielded: other callers waiting on the same file keep their result if this one is cancelled
+        return await asyncio.shield(future)
+
+    async def _flush_after(self, delay: float) -> None:
+        """Flush pending files once the batching window has elapsed."""
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Check all pending files in one run and resolve each caller's future."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return
+
+            try:
+                result = await self._current_checker().check_files_async(list(batch))
+
+                # Split issues back out per file; tool-level and project-wide issues go to every caller
+                per_file: dict[str, list] = {os.path.abspath(path): [] for path in batch}
+                for issue in result.issues:
+                    bucket = per_file.get(os.path.abspath(issue.file)) if issue.file else None
+                    if bucket is not None:
+                        bucket.append(issue)
+                    else:
+                        for issues in per_file.values():
+                            issues.append(issue)
+
+                for path, future in batch.items():
+                    if not future.done():
+                        future.set_result(
+                            CheckResult(
+                                issues=list(per_file[os.path.abspath(path)]),
+                                files_checked=1,
+                                checks_run=list(result.checks_run),
+                            )
+                        )
+            except Exception as e:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                # Cancelled (or failed with a BaseException): never leave a caller waiting
+                for future in batch.values():
+                    if not future.done():
+                        future.cancel()
 
     async def handle_tool_post(self, event: str, data: dict[str, Any]) -> HookResult:
         """Handle post-tool-use events to check TypeScript/JavaScript files.
@@ -88,45 +259,44 @@ class TsCheckHooks:
             HookResult with action and optional context injection
         """
         if not self.enabled:
-            return HookResult(action="continue")
+            return self._CONTINUE
 
         # Check if this is a file write/edit operation
-        tool_name = data.get("tool_name", "")
-        write_tools = ["write_file", "edit_file", "Write", "Edit", "MultiEdit"]
-
-        if tool_name not in write_tools:
-            return HookResult(action="continue")
+        extract_path = self._PATH_EXTRACTORS.get(data.get("tool_name", ""))
+        if extract_path is None:
+            return self._CONTINUE
 
         # Extract file path from tool input
-        tool_input = data.get("tool_input", {})
-        file_path = tool_input.get("file_path", tool_input.get("path", ""))
+        file_path = extract_path(data.get("tool_input", {}))
 
         if not file_path:
-            return HookResult(action="continue")
+            return self._CONTINUE
+
+        # Skip files no configured pattern could match
+        if self._candidate_suffixes is not None and not file_path.endswith(self._candidate_suffixes):
+            return self._CONTINUE
 
         # Check if this is a TypeScript/JavaScript file
         if not self._matches_patterns(file_path):
-            return HookResult(action="continue")
+            return self._CONTINUE
 
         # Check if file exists (might have been deleted)
-        if not Path(file_path).exists():
-            return HookResult(action="continue")
+        if not os.path.exists(file_path):
+            return self._CONTINUE
 
-        # Run checks
-        result = check_files([file_path], config=self.check_config)
+        # Run checks (batched with other files edited at about the same time)
+        result = await self._check_batched(file_path)
 
         # Filter by report level
-        result.issues = self._filter_by_level(result.issues)
+        result.issues = self._filter_by_level(result)
 
         if result.clean:
-            return HookResult(action="continue")
+            return self._CONTINUE
 
         # Build response based on configuration
-        hook_output = result.to_hook_output()
-
         if self.auto_inject:
             # Inject issues into agent context
-            context_text = f"TS/JS check found issues in {file_path}:\n{hook_output['issues_text']}"
+            context_text = f"TS/JS check found issues in {file_path}:\n{result.format_issues()}"
 
             return HookResult(
                 action="inject_context",
@@ -139,7 +309,7 @@ class TsCheckHooks:
             # Just report to user without context injection
             return HookResult(
                 action="continue",
-                user_message=hook_output["summary"],
+                user_message=result.to_hook_output()["summary"],
                 user_message_level="warning" if result.success else "error",
             )
 
@@ -153,6 +323,9 @@ async def mount(coordinator: Any, config: dict[str, Any] | None = None) -> dict[
 
     Returns:
         Module metadata
+
+    With persistent set, the tsc watch process started by the hooks runs
+    until the hooks are closed (TsCheckHooks.close) or the process exits.
     """
     hooks = TsCheckHooks(config)
 
@@ -173,5 +346,7 @@ async def mount(coordinator: Any, config: dict[str, Any] | None = None) -> dict[
             "report_level": hooks.report_level,
             "auto_inject": hooks.auto_inject,
             "checks": hooks.checks,
+            "persistent": hooks.persistent,
+            "result_cache": hooks.result_cache,
         },
     }
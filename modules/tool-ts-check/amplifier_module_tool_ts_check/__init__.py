@@ -4,13 +4,29 @@ This module provides the `ts_check` tool that agents can use to
 check TypeScript/JavaScript code for formatting, linting, type errors, and stubs.
 """
 
+import asyncio
+import functools
 from typing import Any
 
 from amplifier_core import ToolResult
 
 from ._core import CheckConfig
 from ._core import check_content
-from ._core import check_files
+from ._core import check_files_async
+
+# Check names in bit order for _config_for_mask
+_CHECK_NAMES = ("eslint", "prettier", "tsc", "stubs")
+
+
+@functools.lru_cache(maxsize=16)
+def _config_for_mask(mask: int) -> CheckConfig:
+    """Build the config for a bitmask of enabled checks (one shared instance per combination)."""
+    return CheckConfig(
+        enable_eslint=bool(mask & 1),
+        enable_prettier=bool(mask & 2),
+        enable_tsc=bool(mask & 4),
+        enable_stub_check=bool(mask & 8),
+    )
 
 
 class TsCheckTool:
@@ -87,23 +103,19 @@ Returns:
         checks = input_data.get("checks")
 
         # Build config based on requested checks
-        config_overrides = {}
+        config = None
         if checks:
-            config_overrides["enable_eslint"] = "eslint" in checks
-            config_overrides["enable_prettier"] = "prettier" in checks
-            config_overrides["enable_tsc"] = "tsc" in checks
-            config_overrides["enable_stub_check"] = "stubs" in checks
-
-        config = CheckConfig.from_dict(config_overrides) if config_overrides else None
+            mask = sum(1 << bit for bit, name in enumerate(_CHECK_NAMES) if name in checks)
+            config = _config_for_mask(mask)
 
         # Run checks
         if content:
-            result = check_content(content, config=config)
+            result = await asyncio.to_thread(check_content, content, config=config)
         elif paths:
-            result = check_files(paths, config=config, fix=fix)
+            result = await check_files_async(paths, config=config, fix=fix)
         else:
             # Default to current directory
-            result = check_files(["."], config=config, fix=fix)
+            result = await check_files_async(["."], config=config, fix=fix)
 
         return ToolResult(success=result.success, output=result.to_tool_output())
 
@@ -3,27 +3,67 @@
 This module contains all the checking logic needed by the tool.
 """
 
+import asyncio
+import atexit
+import copy
+import functools
+import hashlib
 import json
+import mmap
+import multiprocessing
+import operator
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from dataclasses import field
-from enum import Enum
+from dataclasses import replace
+from enum import IntEnum
 from pathlib import Path
 from typing import Any
+from typing import overload
 
+try:
+    import ijson
+except ImportError:  # Optional: lets ESLint's JSON report be parsed while it is written
+    ijson = None
 
-class Severity(Enum):
-    """Issue severity levels."""
+try:
+    import simdjson
+except ImportError:  # Optional: parses ESLint's JSON report lazily, materializing only the fields read
+    simdjson = None
 
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-@dataclass
+class Severity(IntEnum):
+    """Issue severity levels, ordered from most to least severe."""
+
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in output ("error", "warning", "info")."""
+        return self.name.lower()
+
+
+@dataclass(slots=True, frozen=True)
 class Issue:
     """A single code quality issue."""
 
@@ -38,6 +78,10 @@ class Issue:
     end_line: int | None = None
     end_column: int | None = None
 
+    def format(self) -> str:
+        """Format as a single "file:line:column: [code] message" line."""
+        return f"{self.file}:{self.line}:{self.column}: [{self.code}] {self.message}"
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -46,15 +90,20 @@ class Issue:
             "column": self.column,
             "code": self.code,
             "message": self.message,
-            "severity": self.severity.value,
+            "severity": self.severity.label,
             "source": self.source,
             "suggestion": self.suggestion,
             "end_line": self.end_line,
             "end_column": self.end_column,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Issue":
+        """Create an issue from to_dict output."""
+        return cls(**{**data, "severity": Severity[data["severity"].upper()]})
+
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of running code checks."""
 
@@ -72,19 +121,34 @@ class CheckResult:
         """True if no issues at all."""
         return len(self.issues) == 0
 
+    @property
+    def issues_by_severity(self) -> dict[Severity, list[Issue]]:
+        """Issues grouped by severity, built in a single pass."""
+        buckets: dict[Severity, list[Issue]] = {severity: [] for severity in Severity}
+        for issue in self.issues:
+            buckets[issue.severity].append(issue)
+        return buckets
+
     def merge(self, other: "CheckResult") -> "CheckResult":
-        """Merge another result into this one."""
-        return CheckResult(
-            issues=self.issues + other.issues,
-            files_checked=max(self.files_checked, other.files_checked),
-            checks_run=list(set(self.checks_run + other.checks_run)),
+        """Merge another result into a new one (kept for API compatibility; prefer extend)."""
+        merged = CheckResult(
+            issues=list(self.issues), files_checked=self.files_checked, checks_run=list(self.checks_run)
         )
+        merged.extend(other)
+        return merged
+
+    def extend(self, other: "CheckResult") -> None:
+        """Add another result's issues and checks to this one in place (no copying, unlike merge)."""
+        self.issues.extend(other.issues)
+        self.files_checked = max(self.files_checked, other.files_checked)
+        self.checks_run.extend(check for check in other.checks_run if check not in self.checks_run)
 
     def to_tool_output(self) -> dict[str, Any]:
         """Format for tool output."""
-        errors = [i for i in self.issues if i.severity == Severity.ERROR]
-        warnings = [i for i in self.issues if i.severity == Severity.WARNING]
-        infos = [i for i in self.issues if i.severity == Severity.INFO]
+        by_severity = self.issues_by_severity
+        errors = by_severity[Severity.ERROR]
+        warnings = by_severity[Severity.WARNING]
+        infos = by_severity[Severity.INFO]
 
         summary_parts = []
         if errors:
@@ -111,17 +175,40 @@ class CheckResult:
             "info_count": len(infos),
         }
 
+    def format_issues(self) -> str:
+        """Format issues one per line, indented, for hook injection."""
+        return "\n".join(f"  {i.format()}" for i in self.issues)
+
     def to_hook_output(self) -> dict[str, Any]:
         """Format for hook injection."""
-        issues_text = "\n".join(f"  {i.file}:{i.line}:{i.column}: [{i.code}] {i.message}" for i in self.issues)
         return {
             "summary": f"Found {len(self.issues)} issue(s)",
-            "issues_text": issues_text,
+            "issues_text": self.format_issues(),
             "has_errors": not self.success,
         }
 
 
-@dataclass
+def _glob_regex(glob: str) -> str:
+    """Translate a path glob fragment to regex ("**/" spans directories, "*" and "?" stay within one)."""
+    return (
+        re.escape(glob)
+        .replace(r"\*\*/", "(?:.*/)?")
+        .replace(r"\*\*", ".*")
+        .replace(r"\*", "[^/]*")
+        .replace(r"\?", "[^/]")
+    )
+
+
+def _exclude_regex(pattern: str) -> str:
+    """Translate an exclude pattern ("dir/**", "*.ext", or a substring) to a regex for POSIX paths."""
+    if pattern.endswith("/**"):
+        return f"(?:^|/){_glob_regex(pattern[:-3])}/"
+    if pattern.startswith("*.") and not any(c in pattern[1:] for c in "*?/"):
+        return f"{re.escape(pattern[1:])}$"
+    return _glob_regex(pattern)
+
+
+@dataclass(slots=True)
 class CheckConfig:
     """Configuration for the checker."""
 
@@ -130,6 +217,27 @@ class CheckConfig:
     enable_tsc: bool = True
     enable_stub_check: bool = True
 
+    # Run the read-only checks concurrently (one thread per check)
+    parallel: bool = True
+
+    # Stub-check large file sets across worker processes (one per CPU)
+    stub_check_parallel: bool = True
+
+    # ESLint --concurrency value: "auto", "off", or a thread count (ignored before ESLint 9.34)
+    eslint_concurrency: str = "auto"
+
+    # Pass --cache to ESLint so unchanged files are not re-linted
+    eslint_cache: bool = True
+
+    # Run ESLint through eslint_d when it is installed, reusing its warm Node process between checks
+    eslint_daemon: bool = True
+
+    # Keep a tsc --watch process alive between checks (for long-lived hosts like hooks)
+    persistent: bool = False
+
+    # Reuse ESLint and Prettier results for files whose content has not changed since the last check
+    result_cache: bool = False
+
     exclude_patterns: list[str] = field(
         default_factory=lambda: [
             "node_modules/**",
@@ -155,6 +263,41 @@ class CheckConfig:
         ]
     )
 
+    # Compiled from stub_patterns in __post_init__
+    compiled_stub_patterns: list[tuple[re.Pattern[str], str]] = field(init=False, repr=False, compare=False)
+    stub_prefilter: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    stub_prefilter_bytes: re.Pattern[bytes] | None = field(init=False, repr=False, compare=False)
+    stub_prefilter_folded: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    exclude_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    exclude_dir_names: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile stub patterns (plus one combined alternation) and exclude patterns once."""
+        self.compiled_stub_patterns = [
+            (re.compile(pattern, re.IGNORECASE), description) for pattern, description in self.stub_patterns
+        ]
+        combined = "|".join(f"(?:{pattern})" for pattern, _ in self.stub_patterns)
+        self.stub_prefilter = re.compile(combined, re.IGNORECASE) if self.stub_patterns else None
+        # Same alternation for scanning raw bytes of ASCII files; only exact for ASCII patterns
+        self.stub_prefilter_bytes = (
+            re.compile(combined.encode("ascii"), re.IGNORECASE) if self.stub_patterns and combined.isascii() else None
+        )
+        # Lowercased, case-sensitive alternation for scanning lowercased ASCII text (no per-char case
+        # folding); only when lowercasing keeps the regex's meaning (no uppercase escapes like \S)
+        foldable = self.stub_patterns and combined.isascii() and not re.search(r"\\[A-Z]", combined)
+        self.stub_prefilter_folded = re.compile(combined.lower()) if foldable else None
+        self.exclude_re = (
+            re.compile("|".join(f"(?:{_exclude_regex(pattern)})" for pattern in self.exclude_patterns))
+            if self.exclude_patterns
+            else None
+        )
+        # Plain "name/**" patterns, so the source walk can prune those directories by name alone
+        self.exclude_dir_names = frozenset(
+            pattern[:-3]
+            for pattern in self.exclude_patterns
+            if pattern.endswith("/**") and not any(c in pattern[:-3] for c in "*?/")
+        )
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CheckConfig":
         """Create config from dictionary, using defaults for missing values."""
@@ -163,21 +306,68 @@ class CheckConfig:
             enable_prettier=data.get("enable_prettier", True),
             enable_tsc=data.get("enable_tsc", True),
             enable_stub_check=data.get("enable_stub_check", True),
+            parallel=data.get("parallel", True),
+            stub_check_parallel=data.get("stub_check_parallel", True),
+            eslint_concurrency=str(data.get("eslint_concurrency", "auto")),
+            eslint_cache=data.get("eslint_cache", True),
+            eslint_daemon=data.get("eslint_daemon", True),
+            persistent=data.get("persistent", False),
+            result_cache=data.get("result_cache", False),
             exclude_patterns=data.get("exclude_patterns", cls().exclude_patterns),
         )
 
 
+# Config files that configure ESLint when present in the project root
+_ESLINT_CONFIG_NAMES = (
+    ".eslintrc",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.json",
+    ".eslintrc.yaml",
+    ".eslintrc.yml",
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of a path in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def find_project_root(start_path: Path | None = None) -> Path | None:
     """Find project root by looking for package.json or tsconfig.json."""
-    current = start_path or Path.cwd()
+    try:
+        return _find_project_root(start_path or Path.cwd())
+    except FileNotFoundError:
+        return None
+
 
+@functools.lru_cache(maxsize=256)
+def _find_project_root(current: Path) -> Path:
+    """Walk up from a directory to the project root (memoized per start directory).
+
+    Raises FileNotFoundError when there is none; lru_cache does not cache
+    exceptions, so a project created later in the session is still found.
+    """
     for path in [current] + list(current.parents):
         if (path / "package.json").exists():
             return path
         if (path / "tsconfig.json").exists():
             return path
 
-    return None
+    raise FileNotFoundError(f"No package.json or tsconfig.json above {current}")
 
 
 def load_config(project_root: Path | None = None) -> CheckConfig:
@@ -189,12 +379,18 @@ def load_config(project_root: Path | None = None) -> CheckConfig:
         return CheckConfig()
 
     package_json = project_root / "package.json"
-    if not package_json.exists():
+    # Each caller gets its own copy, so mutating it cannot change the cached config
+    return copy.deepcopy(_load_package_config(package_json, _mtime_ns(package_json)))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_package_config(package_json: Path, mtime_ns: int | None) -> CheckConfig:
+    """Parse config from package.json; keyed on its mtime so edits are picked up."""
+    if mtime_ns is None:
         return CheckConfig()
 
     try:
-        with open(package_json) as f:
-            pkg: dict[str, Any] = json.load(f)
+        pkg: dict[str, Any] = json_loads(package_json.read_bytes())
 
         config_data: dict[str, Any] = pkg.get("amplifier-ts-dev", {})
         return CheckConfig.from_dict(config_data)
@@ -207,27 +403,20 @@ def has_eslint_config(project_root: Path | None = None) -> bool:
     if project_root is None:
         project_root = find_project_root() or Path.cwd()
 
-    eslint_configs = [
-        ".eslintrc",
-        ".eslintrc.js",
-        ".eslintrc.cjs",
-        ".eslintrc.json",
-        ".eslintrc.yaml",
-        ".eslintrc.yml",
-        "eslint.config.js",
-        "eslint.config.mjs",
-        "eslint.config.cjs",
-    ]
-
-    for config in eslint_configs:
+    return _has_eslint_config(project_root, _mtime_ns(project_root), _mtime_ns(project_root / "package.json"))
+
+
+@functools.lru_cache(maxsize=64)
+def _has_eslint_config(project_root: Path, root_mtime_ns: int | None, package_json_mtime_ns: int | None) -> bool:
+    """Look for ESLint config in a project (keyed on project dir and package.json mtimes)."""
+    for config in _ESLINT_CONFIG_NAMES:
         if (project_root / config).exists():
             return True
 
     package_json = project_root / "package.json"
     if package_json.exists():
         try:
-            with open(package_json) as f:
-                pkg: dict[str, Any] = json.load(f)
+            pkg: dict[str, Any] = json_loads(package_json.read_bytes())
             if "eslintConfig" in pkg:
                 return True
         except (json.JSONDecodeError, OSError):
@@ -244,17 +433,417 @@ def has_typescript_config(project_root: Path | None = None) -> bool:
     return (project_root / "tsconfig.json").exists()
 
 
+class ResultCache:
+    """Issues found per file by each check, keyed by content digest and persisted as JSON.
+
+    Entries are only valid for one fingerprint; validate() drops them all when it changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fingerprint: str | None = None
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._digests: dict[str, tuple[int, int, str]] = {}
+
+    def validate(self, fingerprint: str) -> None:
+        """Load the cache if needed, discarding entries recorded under another fingerprint."""
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            if self._fingerprint != fingerprint:
+                self._fingerprint = fingerprint
+                self._entries = {}
+                self._dirty = True
+
+    def _load(self) -> None:
+        """Read the cache file; a missing or unreadable file starts an empty cache."""
+        try:
+            data = json_loads(self.path.read_bytes())
+            self._fingerprint = data["fingerprint"]
+            self._entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._fingerprint = None
+            self._entries = {}
+
+    def digest(self, path: str) -> str | None:
+        """Content digest of a file (reused while its mtime and size are unchanged), or None if unreadable."""
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+            known = self._digests.get(key)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                return known[2]
+            with open(key, "rb") as f:
+                digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        except OSError:
+            return None
+        self._digests[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def get(self, check: str, path: str, digest: str) -> list[Issue] | None:
+        """Issues a check found in a file with this content, or None if not cached."""
+        entry = (self._entries or {}).get(check, {}).get(os.path.abspath(path))
+        if entry is None or entry["digest"] != digest:
+            return None
+        return [Issue.from_dict(issue) for issue in entry["issues"]]
+
+    def put(self, check: str, path: str, digest: str, issues: list[Issue]) -> None:
+        """Record the issues a check found in a file with this content."""
+        with self._lock:
+            if self._entries is None:
+                return
+            self._entries.setdefault(check, {})[os.path.abspath(path)] = {
+                "digest": digest,
+                "issues": [issue.to_dict() for issue in issues],
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache file if anything changed, dropping entries for deleted files."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            for entries in self._entries.values():
+                for path in [path for path in entries if not os.path.exists(path)]:
+                    del entries[path]
+            data = {"fingerprint": self._fingerprint, "entries": self._entries}
+            encoded = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".results-")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp, self.path)
+            except OSError:
+                return
+            self._dirty = False
+
+
+# One tsc diagnostic per line: file(line,col): error TSxxxx: message
+_TSC_LINE_RE = re.compile(
+    r"^[^\S\n]*(.+?)\((\d+),(\d+)\):[^\S\n]+(error|warning)[^\S\n]+(TS\d+):[^\S\n]+(.+?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+_ESLINT_SEVERITY = {2: Severity.ERROR, 1: Severity.WARNING}
+
+
+def _stream_lines(cmd: list[str], timeout: float = 120) -> Iterator[str]:
+    """Run cmd and yield its stdout lines as written; killed after timeout (then TimeoutExpired is raised)."""
+    timed_out = threading.Event()
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        assert proc.stdout is not None  # stdout=PIPE
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            yield from proc.stdout
+        except GeneratorExit:
+            # Consumer stopped early; don't wait for the process to finish on its own
+            proc.kill()
+            raise
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+
+def _tool_version(executable: str) -> tuple[int, ...] | None:
+    """Get a tool's version as a tuple of ints (probed once per installed executable)."""
+    try:
+        mtime_ns = os.stat(executable).st_mtime_ns
+    except OSError:
+        return None
+    return _probe_tool_version(executable, mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_tool_version(executable: str, mtime_ns: int) -> tuple[int, ...] | None:
+    """Run executable --version; keyed on its mtime, so an upgraded tool is probed again."""
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", result.stdout)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups(default="0"))
+
+
+# Project-root files that change what ESLint or Prettier report
+_TOOL_CONFIG_PREFIXES = (
+    ".eslintrc",
+    ".eslintignore",
+    "eslint.config",
+    ".prettierrc",
+    ".prettierignore",
+    "prettier.config",
+    ".editorconfig",
+    "package.json",
+)
+
+# Temp files for content checks go to tmpfs when available
+_CONTENT_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Stub-check workers are started without fork: the check runs on a pool thread, and forking a
+# multi-threaded process can deadlock the child
+_STUB_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_STUB_MMAP_THRESHOLD = 64 * 1024
+_TEXT_ONLY_BYTES_RE = re.compile(rb"[\r\x1c-\x1f\x80-\xff]")
+
+
+def _usable_cpu_count() -> int:
+    """Number of CPUs this process may run on (its affinity mask, where the platform has one)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@overload
+def _iter_candidate_lines(
+    content: str, prefilter: re.Pattern[str], newline: str, haystack: str | None = None
+) -> Iterator[tuple[int, str]]: ...
+
+
+@overload
+def _iter_candidate_lines(
+    content: bytes | mmap.mmap, prefilter: re.Pattern[bytes], newline: bytes
+) -> Iterator[tuple[int, bytes]]: ...
+
+
+def _iter_candidate_lines(
+    content: Any, prefilter: re.Pattern[Any], newline: Any, haystack: str | None = None
+) -> Iterator[tuple[int, Any]]:
+    """Yield (line number, line) for each line the prefilter regex matches in content.
+
+    If given, haystack (a lowercased copy of content, same offsets) is scanned instead.
+    """
+    text = content if haystack is None else haystack
+    line_num = 1
+    line_start = 0
+    pos = 0
+    while (match := prefilter.search(text, pos)) is not None:
+        start = text.rfind(newline, 0, match.start()) + 1
+        end = text.find(newline, match.start())
+        if end == -1:
+            end = len(text)
+        line_num += text[line_start:start].count(newline)
+        line_start = start
+        pos = end + 1
+        yield line_num, content[start:end]
+
+
+def _check_file_for_stubs(file_path: Path, config: CheckConfig) -> list[Issue]:
+    """Check a single file for stub patterns."""
+    issues = []
+    if config.stub_prefilter is None or _is_legitimate_stub_file(file_path):
+        return issues
+
+    # Scripts and tools may legitimately print to the console
+    file_str = str(file_path).lower()
+    allow_console = "/scripts/" in file_str or "/tools/" in file_str
+
+    try:
+        candidates = _stub_candidate_lines(file_path, config)
+    except Exception:
+        return issues
+
+    for line_num, line in candidates:
+        if allow_console and "console." in line:
+            continue
+
+        for pattern, description in config.compiled_stub_patterns:
+            if pattern.search(line):
+                issues.append(
+                    Issue(
+                        file=str(file_path),
+                        line=line_num,
+                        column=1,
+                        code="STUB",
+                        message=f"{description}: {line.strip()[:60]}",
+                        severity=Severity.WARNING,
+                        source="stub-check",
+                        suggestion="Remove placeholder or implement functionality",
+                    )
+                )
+
+    return issues
+
+
+def _stub_candidate_lines(file_path: Path, config: CheckConfig) -> list[tuple[int, str]]:
+    """Find the lines of a file that the combined stub regex matches (large ASCII files via mmap)."""
+    prefilter = config.stub_prefilter
+    if prefilter is None:
+        return []
+
+    bytes_prefilter = config.stub_prefilter_bytes
+    if bytes_prefilter is not None and file_path.stat().st_size > _STUB_MMAP_THRESHOLD:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _TEXT_ONLY_BYTES_RE.search(mm) is None:
+                return [
+                    (line_num, line.decode("ascii"))
+                    for line_num, line in _iter_candidate_lines(mm, bytes_prefilter, b"\n")
+                ]
+
+    content = file_path.read_text(encoding="utf-8")
+    # Matching lowercased ASCII text case-sensitively is much cheaper than IGNORECASE
+    if config.stub_prefilter_folded is not None and content.isascii():
+        return list(_iter_candidate_lines(content, config.stub_prefilter_folded, "\n", haystack=content.lower()))
+    return list(_iter_candidate_lines(content, prefilter, "\n"))
+
+
+def _is_legitimate_stub_file(file_path: Path) -> bool:
+    """Check if stub patterns are legitimate anywhere in this file."""
+    file_str = str(file_path).lower()
+
+    if "test" in file_str or "spec" in file_str or "__tests__" in file_str:
+        return True
+
+    if file_path.name in ("jest.config.js", "webpack.config.js", "vite.config.ts"):
+        return True
+
+    return file_path.suffix == ".d.ts"
+
+
+class PersistentToolRunner:
+    """A long-running `tsc --watch` process whose latest diagnostics are served on demand."""
+
+    # Status lines tsc --watch --pretty false prints around each compilation ("<time> - ...")
+    _STARTED_RE = re.compile(r" - (?:Starting compilation in watch mode|File change detected)")
+    _FINISHED_RE = re.compile(r" - Found \d+ errors?\b")
+
+    # How long to wait for tsc to notice an edit before serving the last result
+    SETTLE_TIME = 1.0
+
+    def __init__(self, cmd: list[str]):
+        """Start the watch process and a thread that collects its output."""
+        self.cmd = cmd
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        self._cond = threading.Condition()
+        self._building = False
+        self._exited = False
+        self._output: str | None = None
+        self._output_started = 0.0  # wall-clock start of the compilation that produced _output
+        threading.Thread(target=self._read_output, daemon=True).start()
+        atexit.register(self.close)
+
+    @property
+    def alive(self) -> bool:
+        """True while the watch process is running."""
+        return not self._exited and self._proc.poll() is None
+
+    @property
+    def has_output(self) -> bool:
+        """True once the watch process has finished at least one compilation."""
+        return self._output is not None
+
+    def _read_output(self) -> None:
+        """Collect diagnostics between compilation start and finish markers."""
+        assert self._proc.stdout is not None
+        lines: list[str] = []
+        started = 0.0
+        for line in self._proc.stdout:
+            if self._STARTED_RE.search(line):
+                lines, started = [], time.time()
+                with self._cond:
+                    self._building = True
+            elif self._FINISHED_RE.search(line):
+                with self._cond:
+                    self._output, self._output_started, self._building = "".join(lines), started, False
+                    self._cond.notify_all()
+            else:
+                lines.append(line)
+
+        with self._cond:
+            self._building, self._exited = False, True
+            self._cond.notify_all()
+
+    def check(self, paths: list[str], timeout: float = 120) -> str | None:
+        """Return tsc's output once it has compiled the current contents of the given files.
+
+        Returns None if the watch process is not running.
+        """
+        newest = max((os.stat(p).st_mtime for p in paths if os.path.isfile(p)), default=0.0)
+        now = time.monotonic()
+        deadline, settle_deadline = now + timeout, now + self.SETTLE_TIME
+
+        with self._cond:
+            while self.alive:
+                idle = self._output is not None and not self._building
+                if idle and self._output_started >= newest:
+                    return self._output
+
+                now = time.monotonic()
+                if now >= deadline:
+                    raise subprocess.TimeoutExpired(self.cmd, timeout)
+                # An edit tsc does not rebuild for (e.g. a file outside the project) never gets a newer result
+                if idle and now >= settle_deadline:
+                    return self._output
+
+                self._cond.wait((settle_deadline if idle else deadline) - now)
+
+        return None
+
+    def close(self) -> None:
+        """Stop the watch process."""
+        atexit.unregister(self.close)
+        if self.alive:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+
 class TypeScriptChecker:
     """Main checker that orchestrates ESLint, Prettier, tsc, and stub detection."""
 
     TS_EXTENSIONS = {".ts", ".tsx", ".mts", ".cts"}
     JS_EXTENSIONS = {".js", ".jsx", ".mjs", ".cjs"}
     ALL_EXTENSIONS = TS_EXTENSIONS | JS_EXTENSIONS
+    _SOURCE_SUFFIXES = tuple(ALL_EXTENSIONS)
+    _VCS_DIRS = frozenset({".git", ".hg", ".svn"})
+    STUB_PARALLEL_MIN_FILES = 5000
+    PRETTIER_CHUNK_MIN_FILES = 200
 
     def __init__(self, config: CheckConfig | None = None):
         """Initialize checker with optional config."""
-        self.config = config or load_config()
         self.project_root = find_project_root()
+        self.config = config or load_config(self.project_root)
+        # Tools keep their incremental caches under the project's node_modules/.cache
+        self.cache_dir = self.project_root / "node_modules" / ".cache" if self.project_root else None
+        self._tsc_watch: PersistentToolRunner | None = None
+        self._tsc_watch_lock = threading.Lock()
+
+        # Resolved tool executables (None if not installed), looked up once per checker
+        self._executables: dict[str, tuple[int | None, str]] = {}
+
+        # Per-file ESLint/Prettier results, when config.result_cache is set
+        self._result_cache = (
+            ResultCache(self.cache_dir / "amplifier-ts-check" / "results.json")
+            if self.config.result_cache and self.cache_dir
+            else None
+        )
+
+    def close(self) -> None:
+        """Stop any persistent tool processes started by this checker."""
+        with self._tsc_watch_lock:
+            if self._tsc_watch is not None:
+                self._tsc_watch.close()
+                self._tsc_watch = None
 
     def check_files(self, paths: list[str | Path], fix: bool = False) -> CheckResult:
         """Run all enabled checks on the given paths."""
@@ -262,67 +851,253 @@ class TypeScriptChecker:
             paths = [Path.cwd()]
 
         path_strs = [str(p) for p in paths]
-        results = CheckResult(files_checked=self._count_ts_js_files(path_strs))
+        sources = self._source_files(path_strs)
+        results = CheckResult(files_checked=len(sources[0]) + len(sources[1]))
 
-        if self.config.enable_eslint:
-            eslint_result = self._run_eslint(path_strs, fix=fix)
-            results = results.merge(eslint_result)
+        fixers, checks = self._enabled_checks(path_strs, sources, fix=fix)
 
-        if self.config.enable_prettier:
-            prettier_result = self._run_prettier(path_strs, fix=fix)
-            results = results.merge(prettier_result)
+        for fixer in fixers:
+            results.extend(fixer())
 
-        if self.config.enable_tsc:
-            tsc_result = self._run_tsc(path_strs)
-            results = results.merge(tsc_result)
+        for check_result in self._run_checks(checks):
+            results.extend(check_result)
 
-        if self.config.enable_stub_check:
-            stub_result = self._run_stub_check(path_strs)
-            results = results.merge(stub_result)
+        if self._result_cache is not None:
+            self._result_cache.save()
+
+        return results
+
+    async def check_files_async(self, paths: list[str | Path], fix: bool = False) -> CheckResult:
+        """Run all enabled checks concurrently on the given paths (fixers first, one at a time)."""
+        if not paths:
+            paths = [Path.cwd()]
+
+        path_strs = [str(p) for p in paths]
+        sources = await asyncio.to_thread(self._source_files, path_strs)
+        results = CheckResult(files_checked=len(sources[0]) + len(sources[1]))
+        fixers, checks = self._enabled_checks(path_strs, sources, fix=fix)
+
+        for fixer in fixers:
+            results.extend(await asyncio.to_thread(fixer))
+
+        if self.config.parallel:
+            for check_result in await asyncio.gather(*(asyncio.to_thread(check) for check in checks)):
+                results.extend(check_result)
+        else:
+            for check in checks:
+                results.extend(await asyncio.to_thread(check))
+
+        if self._result_cache is not None:
+            await asyncio.to_thread(self._result_cache.save)
 
         return results
 
+    def _run_checks(self, checks: list[Callable[[], CheckResult]]) -> list[CheckResult]:
+        """Run read-only checks, concurrently in a thread pool unless config.parallel is off."""
+        if self.config.parallel and len(checks) > 1:
+            with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+                return list(pool.map(operator.call, checks))
+        return [check() for check in checks]
+
+    def _enabled_checks(
+        self, paths: list[str], sources: tuple[list[Path], list[Path]] | None = None, fix: bool = False
+    ) -> tuple[list[Callable[[], CheckResult]], list[Callable[[], CheckResult]]]:
+        """Build the enabled checks as zero-argument callables.
+
+        Returns (fixers, checks): fixers rewrite files and must run one at a time
+        before anything else; checks are read-only and can run concurrently.
+        The stub check reuses sources (from _source_files) when given.
+        """
+        fixers: list[Callable[[], CheckResult]] = []
+        checks: list[Callable[[], CheckResult]] = []
+        # Cached results are per file, so only read-only runs on source files given directly use them
+        cached = (
+            self._result_cache is not None
+            and not fix
+            and sources is not None
+            and not sources[1]
+            and len(sources[0]) == len(paths)
+        )
+        if self.config.enable_eslint:
+            if cached:
+                checks.append(functools.partial(self._run_cached, "eslint", paths, self._run_eslint))
+            else:
+                (fixers if fix else checks).append(functools.partial(self._run_eslint, paths, fix=fix))
+        if self.config.enable_prettier:
+            if cached:
+                checks.append(functools.partial(self._run_cached, "prettier", paths, self._run_prettier))
+            else:
+                (fixers if fix else checks).append(functools.partial(self._run_prettier, paths, fix=fix))
+        if self.config.enable_tsc:
+            checks.append(functools.partial(self._run_tsc, paths))
+        if self.config.enable_stub_check:
+            checks.append(functools.partial(self._run_stub_check, paths, sources))
+        return fixers, checks
+
+    def _run_cached(self, check: str, paths: list[str], run: Callable[[list[str]], CheckResult]) -> CheckResult:
+        """Run a per-file check only on files without cached results, caching its issues per file.
+
+        Nothing is cached from a run that reports tool-level issues (no file), such as a timeout.
+        """
+        cache = self._result_cache
+        assert cache is not None
+        cache.validate(self._result_cache_fingerprint())
+
+        issues: list[Issue] = []
+        misses: dict[str, str] = {}
+        for path in paths:
+            digest = cache.digest(path) or ""  # Unreadable files are checked but not cached
+            cached = cache.get(check, path, digest) if digest else None
+            if cached is None:
+                misses[path] = digest
+            else:
+                issues.extend(cached)
+        if not misses:
+            return CheckResult(issues=issues, checks_run=[check])
+
+        result = run(list(misses))
+        issues.extend(result.issues)
+
+        if all(issue.file for issue in result.issues):
+            per_file: dict[str, list[Issue]] = {os.path.abspath(path): [] for path in misses}
+            for issue in result.issues:
+                bucket = per_file.get(os.path.abspath(issue.file))
+                if bucket is not None:
+                    bucket.append(issue)
+            for path, digest in misses.items():
+                if digest:
+                    cache.put(check, path, digest, per_file[os.path.abspath(path)])
+
+        return CheckResult(issues=issues, checks_run=result.checks_run)
+
+    def _result_cache_fingerprint(self) -> str:
+        """Digest of the checker config, ESLint/Prettier versions, and project-root tool config mtimes."""
+        parts = [repr(self.config)]
+        for name in ("eslint", "prettier"):
+            executable = self._find_executable(name)
+            parts.append(f"{executable} {_tool_version(executable) if executable else None}")
+        if self.project_root:
+            try:
+                with os.scandir(self.project_root) as entries:
+                    parts.extend(
+                        sorted(
+                            f"{entry.name} {entry.stat().st_mtime_ns}"
+                            for entry in entries
+                            if entry.name.startswith(_TOOL_CONFIG_PREFIXES)
+                        )
+                    )
+            except OSError:
+                pass
+        return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
     def check_content(self, content: str, filename: str = "stdin.ts") -> CheckResult:
-        """Check TypeScript/JavaScript content string."""
+        """Check TypeScript/JavaScript content string.
+
+        ESLint and Prettier read the content on stdin; tsc and the stub check use a temp file.
+        """
         ext = Path(filename).suffix or ".ts"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=ext, delete=False) as f:
-            f.write(content)
-            temp_path = f.name
+        checks: list[Callable[[], CheckResult]] = []
+        if self.config.enable_eslint:
+            checks.append(functools.partial(self._run_eslint, [filename], content=content))
+        if self.config.enable_prettier:
+            checks.append(functools.partial(self._run_prettier, [filename], content=content))
+
+        temp_path = None
+        if self.config.enable_tsc or self.config.enable_stub_check:
+            with tempfile.NamedTemporaryFile(mode="w", suffix=ext, dir=_CONTENT_TEMP_DIR, delete=False) as f:
+                f.write(content)
+                temp_path = f.name
+            if self.config.enable_tsc:
+                checks.append(functools.partial(self._run_tsc, [temp_path]))
+            if self.config.enable_stub_check:
+                checks.append(functools.partial(self._run_stub_check, [temp_path]))
 
         try:
-            result = self.check_files([temp_path])
-            for issue in result.issues:
-                if issue.file == temp_path:
-                    issue.file = filename
+            result = CheckResult(files_checked=int(ext in self.ALL_EXTENSIONS))
+            for check_result in self._run_checks(checks):
+                result.extend(check_result)
+            if temp_path is not None:
+                result.issues = [
+                    replace(issue, file=filename) if issue.file and os.path.abspath(issue.file) == temp_path else issue
+                    for issue in result.issues
+                ]
             return result
         finally:
-            Path(temp_path).unlink(missing_ok=True)
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
 
     def _count_ts_js_files(self, paths: list[str]) -> int:
         """Count TypeScript/JavaScript files in the given paths."""
-        count = 0
+        given, found = self._source_files(paths)
+        return len(given) + len(found)
+
+    def _source_files(self, paths: list[str]) -> tuple[list[Path], list[Path]]:
+        """List TypeScript/JavaScript files as (files given directly, files found under directories)."""
+        given: list[Path] = []
+        found: list[Path] = []
         for path_str in paths:
             path = Path(path_str)
             if path.is_file() and path.suffix in self.ALL_EXTENSIONS:
-                count += 1
+                given.append(path)
             elif path.is_dir():
-                for ext in self.ALL_EXTENSIONS:
-                    count += len(list(path.rglob(f"*{ext}")))
-        return count
+                found.extend(self._iter_source_files(path))
+        return given, found
+
+    def _iter_source_files(self, root: Path) -> Iterator[Path]:
+        """Yield TypeScript/JavaScript files under a directory in a single walk, skipping excluded directories."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            self._prune_excluded_dirs(dirpath, dirnames)
+            for filename in filenames:
+                if filename.endswith(self._SOURCE_SUFFIXES):
+                    yield Path(dirpath, filename)
+
+    def _prune_excluded_dirs(self, dirpath: str, dirnames: list[str]) -> None:
+        """Drop VCS and excluded directories from an os.walk dirnames list in place (by name, then by regex)."""
+        if not dirnames:
+            return
+        dirnames[:] = [name for name in dirnames if name not in self._VCS_DIRS]
+        exclude_re = self.config.exclude_re
+        if exclude_re is None:
+            return
+        excluded_names = self.config.exclude_dir_names
+        prefix = Path(dirpath).as_posix()
+        dirnames[:] = [
+            name for name in dirnames if name not in excluded_names and exclude_re.search(f"{prefix}/{name}/") is None
+        ]
+
+    def _path_chunks(self, paths: list[str], min_files: int) -> list[list[str]]:
+        """Split files into one group per CPU by path hash; [] for few files, one CPU, or any directory."""
+        workers = _usable_cpu_count()
+        if workers < 2 or len(paths) < min_files or any(os.path.isdir(path) for path in paths):
+            return []
+        chunks: list[list[str]] = [[] for _ in range(workers)]
+        for path in paths:
+            chunks[zlib.crc32(os.fsencode(path)) % workers].append(path)
+        return chunks
 
     def _find_executable(self, name: str) -> str | None:
-        """Find executable, preferring local node_modules."""
-        if self.project_root:
-            local_bin = self.project_root / "node_modules" / ".bin" / name
+        """Find executable, preferring local node_modules (hits cached until node_modules/.bin changes)."""
+        local_bin_dir = self.project_root / "node_modules" / ".bin" if self.project_root else None
+        bin_mtime_ns = _mtime_ns(local_bin_dir) if local_bin_dir else None
+        cached = self._executables.get(name)
+        if cached is not None and cached[0] == bin_mtime_ns:
+            return cached[1]
+
+        executable = None
+        if local_bin_dir and bin_mtime_ns is not None:
+            local_bin = local_bin_dir / name
             if local_bin.exists():
-                return str(local_bin)
+                executable = str(local_bin)
 
-        return shutil.which(name)
+        executable = executable or shutil.which(name)
+        if executable:
+            self._executables[name] = (bin_mtime_ns, executable)
+        return executable
 
-    def _run_eslint(self, paths: list[str], fix: bool = False) -> CheckResult:
-        """Run ESLint check."""
-        eslint = self._find_executable("eslint")
+    def _run_eslint(self, paths: list[str], fix: bool = False, content: str | None = None) -> CheckResult:
+        """Run ESLint check (on content piped to stdin as the single file in paths, if given)."""
+        eslint = (self.config.eslint_daemon and self._find_executable("eslint_d")) or self._find_executable("eslint")
 
         if not eslint:
             return CheckResult(
@@ -344,13 +1119,37 @@ class TypeScriptChecker:
         if fix:
             cmd.append("--fix")
 
+        # Flags depend on the ESLint version; eslint_d reports its own, so ask eslint itself
+        plain_eslint = self._find_executable("eslint")
+        version = _tool_version(plain_eslint) if plain_eslint else None
+
+        # Content strategy: git checkouts touch mtimes without changing files (ESLint 7.21+)
+        if self.config.eslint_cache and content is None:
+            cmd.append("--cache")
+            if version and version >= (7, 21):
+                cmd.extend(["--cache-strategy", "content"])
+            if self.cache_dir:
+                cmd.extend(["--cache-location", f"{self.cache_dir / 'eslint'}/"])
+
         if not has_eslint_config(self.project_root):
             cmd.extend(["--no-eslintrc", "--env", "browser,node,es2022"])
 
-        cmd.extend(paths)
+        if self.config.eslint_concurrency != "off" and version and version >= (9, 34) and content is None:
+            cmd.extend(["--concurrency", self.config.eslint_concurrency])
+
+        if content is not None:
+            cmd.extend(["--stdin", "--stdin-filename", paths[0]])
+        else:
+            cmd.extend(paths)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if ijson is not None and content is None:
+                issues = self._stream_eslint(cmd)
+            else:
+                result = subprocess.run(cmd, input=content, capture_output=True, text=True, timeout=120)
+                issues = self._parse_eslint_report(result.stdout)
+                if content is not None:
+                    issues = [replace(issue, file=paths[0]) for issue in issues]
         except subprocess.TimeoutExpired:
             return CheckResult(
                 issues=[
@@ -382,37 +1181,79 @@ class TypeScriptChecker:
                 checks_run=["eslint"],
             )
 
-        issues = []
-        if result.stdout.strip():
+        return CheckResult(issues=issues, checks_run=["eslint"])
+
+    def _stream_eslint(self, cmd: list[str]) -> list[Issue]:
+        """Run ESLint, building issues from its JSON report as it is written (requires ijson)."""
+        if ijson is None:
+            raise RuntimeError("Streaming the ESLint report requires ijson")
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            timer = threading.Timer(120, kill)
+            timer.start()
             try:
-                eslint_output = json.loads(result.stdout)
-                for file_result in eslint_output:
-                    file_path = file_result.get("filePath", "")
-                    for msg in file_result.get("messages", []):
-                        severity_map = {2: Severity.ERROR, 1: Severity.WARNING}
-                        severity = severity_map.get(msg.get("severity", 1), Severity.WARNING)
+                issues = self._eslint_issues(ijson.items(proc.stdout, "item"))
+            except ijson.JSONError:
+                issues = []
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 120)
+        return issues
 
-                        issues.append(
-                            Issue(
-                                file=file_path,
-                                line=msg.get("line", 0),
-                                column=msg.get("column", 0),
-                                code=msg.get("ruleId") or "eslint",
-                                message=msg.get("message", ""),
-                                severity=severity,
-                                source="eslint",
-                                suggestion=msg.get("fix", {}).get("text") if msg.get("fix") else None,
-                                end_line=msg.get("endLine"),
-                                end_column=msg.get("endColumn"),
-                            )
-                        )
-            except json.JSONDecodeError:
-                pass
+    def _parse_eslint_report(self, output: str) -> list[Issue]:
+        """Build issues from a complete ESLint JSON report."""
+        if not output.strip():
+            return []
+        try:
+            if simdjson is not None:
+                report = simdjson.Parser().parse(output.encode())
+                return self._eslint_issues(report) if isinstance(report, simdjson.Array) else []
+            return self._eslint_issues(json_loads(output))
+        except ValueError:  # json.JSONDecodeError, or simdjson's parse errors
+            return []
+
+    def _eslint_issues(self, file_results: Iterable[Any]) -> list[Issue]:
+        """Convert ESLint per-file results (dicts, or simdjson Objects) into issues."""
+        issues = []
+        for file_result in file_results:
+            file_path = file_result.get("filePath", "")
+            for msg in file_result.get("messages", []):
+                severity = _ESLINT_SEVERITY.get(msg.get("severity", 1), Severity.WARNING)
 
-        return CheckResult(issues=issues, checks_run=["eslint"])
+                issues.append(
+                    Issue(
+                        file=file_path,
+                        line=msg.get("line", 0),
+                        column=msg.get("column", 0),
+                        code=msg.get("ruleId") or "eslint",
+                        message=msg.get("message", ""),
+                        severity=severity,
+                        source="eslint",
+                        suggestion=msg.get("fix", {}).get("text") if msg.get("fix") else None,
+                        end_line=msg.get("endLine"),
+                        end_column=msg.get("endColumn"),
+                    )
+                )
+        return issues
 
-    def _run_prettier(self, paths: list[str], fix: bool = False) -> CheckResult:
-        """Run Prettier format check."""
+    def _run_prettier(
+        self,
+        paths: list[str],
+        fix: bool = False,
+        content: str | None = None,
+    ) -> CheckResult:
+        """Run Prettier format check.
+
+        Large file sets are split into one Prettier process per CPU (see _path_chunks).
+        Content, if given, is piped to stdin and checked as the single file in paths.
+        """
         prettier = self._find_executable("prettier")
 
         if not prettier:
@@ -436,10 +1277,32 @@ class TypeScriptChecker:
         else:
             cmd = [prettier, "--check"]
 
-        cmd.extend(paths)
+        cache_location = None
+        version = _tool_version(prettier)
+        if version and version >= (2, 7):
+            cmd.extend(["--cache", "--cache-strategy", "content"])
+            if self.cache_dir:
+                cache_location = str(self.cache_dir / "prettier" / ".prettier-cache")
+
+        if content is not None:
+            # Prettier prints the formatted text, compared with the content below
+            runs = [[prettier, "--stdin-filepath", paths[0]]]
+        elif chunks := self._path_chunks(paths, self.PRETTIER_CHUNK_MIN_FILES):
+            runs = [
+                [*cmd, *(["--cache-location", f"{cache_location}-{i}"] if cache_location else []), *chunk]
+                for i, chunk in enumerate(chunks)
+                if chunk
+            ]
+        else:
+            runs = [[*cmd, *(["--cache-location", cache_location] if cache_location else []), *paths]]
+        run = functools.partial(subprocess.run, input=content, capture_output=True, text=True, timeout=120)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if len(runs) == 1:
+                results = [run(runs[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(runs)) as pool:
+                    results = list(pool.map(run, runs))
         except subprocess.TimeoutExpired:
             return CheckResult(
                 issues=[
@@ -472,14 +1335,12 @@ class TypeScriptChecker:
             )
 
         issues = []
-        if result.returncode != 0 and not fix:
-            for line in result.stdout.split("\n"):
-                line = line.strip()
-                if line.startswith("[warn]"):
-                    file_path = line[6:].strip()
+        for result in results:
+            if content is not None:
+                if result.returncode == 0 and result.stdout != content:
                     issues.append(
                         Issue(
-                            file=file_path,
+                            file=paths[0],
                             line=1,
                             column=1,
                             code="FORMAT",
@@ -489,22 +1350,52 @@ class TypeScriptChecker:
                             suggestion="Run with --fix to auto-format",
                         )
                     )
-                elif line and not line.startswith("Checking") and Path(line).suffix in self.ALL_EXTENSIONS:
-                    issues.append(
-                        Issue(
-                            file=line,
-                            line=1,
-                            column=1,
-                            code="FORMAT",
-                            message="File would be reformatted",
-                            severity=Severity.WARNING,
-                            source="prettier",
-                            suggestion="Run with --fix to auto-format",
+            elif result.returncode != 0 and not fix:
+                for line in result.stdout.split("\n"):
+                    line = line.strip()
+                    if line.startswith("[warn]"):
+                        file_path = line[6:].strip()
+                        # Every run (one per chunk) ends with a summary line, not a file name
+                        if file_path.startswith("Code style issues"):
+                            continue
+                        issues.append(
+                            Issue(
+                                file=file_path,
+                                line=1,
+                                column=1,
+                                code="FORMAT",
+                                message="File would be reformatted",
+                                severity=Severity.WARNING,
+                                source="prettier",
+                                suggestion="Run with --fix to auto-format",
+                            )
+                        )
+                    elif line and not line.startswith("Checking") and Path(line).suffix in self.ALL_EXTENSIONS:
+                        issues.append(
+                            Issue(
+                                file=line,
+                                line=1,
+                                column=1,
+                                code="FORMAT",
+                                message="File would be reformatted",
+                                severity=Severity.WARNING,
+                                source="prettier",
+                                suggestion="Run with --fix to auto-format",
+                            )
                         )
-                    )
 
         return CheckResult(issues=issues, checks_run=["prettier"])
 
+    def _tsc_watcher(self, cmd: list[str]) -> PersistentToolRunner:
+        """Get the tsc --watch process for cmd, (re)starting it unless it never worked."""
+        with self._tsc_watch_lock:
+            watcher = self._tsc_watch
+            if watcher is None or watcher.cmd != cmd or (not watcher.alive and watcher.has_output):
+                if watcher is not None:
+                    watcher.close()
+                watcher = self._tsc_watch = PersistentToolRunner(cmd)
+            return watcher
+
     def _run_tsc(self, paths: list[str]) -> CheckResult:
         """Run TypeScript type checking."""
         has_ts_files = any(Path(p).suffix in self.TS_EXTENSIONS for p in paths if Path(p).is_file())
@@ -532,14 +1423,25 @@ class TypeScriptChecker:
 
         cmd = [tsc, "--noEmit", "--pretty", "false"]
 
+        watch_cmd = None
+
         if self.project_root and has_typescript_config(self.project_root):
             cmd.extend(["--project", str(self.project_root / "tsconfig.json")])
+            if self.config.persistent:
+                watch_cmd = [tsc, "--watch", "--preserveWatchOutput", *cmd[1:]]
+            version = _tool_version(tsc)
+            if self.cache_dir and version and version >= (4, 0):
+                cmd.extend(["--incremental", "--tsBuildInfoFile", str(self.cache_dir / "tsc" / "tsconfig.tsbuildinfo")])
         else:
             cmd.extend(["--allowJs", "--checkJs", "--strict"])
             cmd.extend(paths)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            output = self._tsc_watcher(watch_cmd).check(paths) if watch_cmd else None
+            if output is not None:
+                issues = self._tsc_issues(_TSC_LINE_RE.finditer(output))
+            else:
+                issues = self._tsc_issues(filter(None, map(_TSC_LINE_RE.match, _stream_lines(cmd))))
         except subprocess.TimeoutExpired:
             return CheckResult(
                 issues=[
@@ -571,110 +1473,52 @@ class TypeScriptChecker:
                 checks_run=["tsc"],
             )
 
-        issues = []
-        tsc_pattern = re.compile(r"(.+?)\((\d+),(\d+)\):\s+(error|warning)\s+(TS\d+):\s+(.+)")
-
-        for line in result.stdout.split("\n"):
-            match = tsc_pattern.match(line.strip())
-            if match:
-                file_path, line_num, col, severity_str, code, message = match.groups()
-                severity = Severity.ERROR if severity_str == "error" else Severity.WARNING
+        return CheckResult(issues=issues, checks_run=["tsc"])
 
-                issues.append(
-                    Issue(
-                        file=file_path,
-                        line=int(line_num),
-                        column=int(col),
-                        code=code,
-                        message=message,
-                        severity=severity,
-                        source="tsc",
-                    )
+    def _tsc_issues(self, matches: Iterable[re.Match[str]]) -> list[Issue]:
+        """Convert tsc diagnostic line matches (from _TSC_LINE_RE) into issues."""
+        issues = []
+        for match in matches:
+            file_path, line_num, col, severity_str, code, message = match.groups()
+            severity = Severity.ERROR if severity_str == "error" else Severity.WARNING
+
+            issues.append(
+                Issue(
+                    file=file_path,
+                    line=int(line_num),
+                    column=int(col),
+                    code=code,
+                    message=message,
+                    severity=severity,
+                    source="tsc",
                 )
+            )
 
-        return CheckResult(issues=issues, checks_run=["tsc"])
+        return issues
 
-    def _run_stub_check(self, paths: list[str]) -> CheckResult:
+    def _run_stub_check(self, paths: list[str], sources: tuple[list[Path], list[Path]] | None = None) -> CheckResult:
         """Check for TODOs, stubs, and placeholder code."""
-        issues = []
+        given, found = sources if sources is not None else self._source_files(paths)
+        files = given + [ts_file for ts_file in found if not self._should_exclude(ts_file)]
 
-        for path_str in paths:
-            path = Path(path_str)
-            if path.is_file() and path.suffix in self.ALL_EXTENSIONS:
-                issues.extend(self._check_file_for_stubs(path))
-            elif path.is_dir():
-                for ext in self.ALL_EXTENSIONS:
-                    for ts_file in path.rglob(f"*{ext}"):
-                        if self._should_exclude(ts_file):
-                            continue
-                        issues.extend(self._check_file_for_stubs(ts_file))
+        check_file = functools.partial(_check_file_for_stubs, config=self.config)
+        workers = _usable_cpu_count()
+        if self.config.stub_check_parallel and workers > 1 and len(files) >= self.STUB_PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_STUB_POOL_CONTEXT) as pool:
+                    file_issues = list(pool.map(check_file, files, chunksize=64))
+            except (OSError, BrokenProcessPool):
+                file_issues = list(map(check_file, files))
+        else:
+            file_issues = list(map(check_file, files))
 
+        issues = [issue for issues in file_issues for issue in issues]
         return CheckResult(issues=issues, checks_run=["stub-check"])
 
     def _should_exclude(self, path: Path) -> bool:
         """Check if path matches any exclude pattern."""
-        path_str = str(path)
-        for pattern in self.config.exclude_patterns:
-            if pattern.endswith("/**"):
-                dir_pattern = pattern[:-3]
-                if dir_pattern in path_str:
-                    return True
-            elif pattern.startswith("*."):
-                if path.suffix == pattern[1:]:
-                    return True
-            elif pattern in path_str:
-                return True
-        return False
-
-    def _check_file_for_stubs(self, file_path: Path) -> list[Issue]:
-        """Check a single file for stub patterns."""
-        issues = []
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-        except Exception:
-            return issues
-
-        for line_num, line in enumerate(lines, 1):
-            for pattern, description in self.config.stub_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if self._is_legitimate_pattern(file_path, line_num, line, lines):
-                        continue
-
-                    issues.append(
-                        Issue(
-                            file=str(file_path),
-                            line=line_num,
-                            column=1,
-                            code="STUB",
-                            message=f"{description}: {line.strip()[:60]}",
-                            severity=Severity.WARNING,
-                            source="stub-check",
-                            suggestion="Remove placeholder or implement functionality",
-                        )
-                    )
-
-        return issues
-
-    def _is_legitimate_pattern(self, file_path: Path, line_num: int, line: str, lines: list[str]) -> bool:
-        """Check if a stub pattern is actually legitimate."""
-        file_str = str(file_path).lower()
-
-        if "test" in file_str or "spec" in file_str or "__tests__" in file_str:
-            return True
-
-        if file_path.name in ("jest.config.js", "webpack.config.js", "vite.config.ts"):
-            return True
-
-        if file_path.suffix == ".d.ts":
-            return True
-
-        if "/scripts/" in file_str or "/tools/" in file_str:
-            if "console." in line:
-                return True
-
-        return False
+        exclude_re = self.config.exclude_re
+        return exclude_re is not None and exclude_re.search(path.as_posix()) is not None
 
 
 def check_files(paths: list[str | Path], config: CheckConfig | None = None, fix: bool = False) -> CheckResult:
@@ -683,6 +1527,14 @@ def check_files(paths: list[str | Path], config: CheckConfig | None = None, fix:
     return checker.check_files(paths, fix=fix)
 
 
+async def check_files_async(
+    paths: list[str | Path], config: CheckConfig | None = None, fix: bool = False
+) -> CheckResult:
+    """Check TypeScript/JavaScript files for issues, running the checks concurrently."""
+    checker = TypeScriptChecker(config)
+    return await checker.check_files_async(paths, fix=fix)
+
+
 def check_content(content: str, filename: str = "stdin.ts", config: CheckConfig | None = None) -> CheckResult:
     """Check TypeScript/JavaScript content string."""
     checker = TypeScriptChecker(config)
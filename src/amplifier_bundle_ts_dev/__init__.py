@@ -15,6 +15,9 @@ Usage:
     # Check content
     result = check_content("const x: any = 1;")
 
+    # Run checks concurrently from async code
+    result = await check_files_async(["src/"])
+
     # With custom config
     config = CheckConfig(enable_prettier=False)
     result = check_files(["src/"], config=config)
@@ -23,6 +26,7 @@ Usage:
 from .checker import TypeScriptChecker
 from .checker import check_content
 from .checker import check_files
+from .checker import check_files_async
 from .config import find_project_root
 from .config import has_eslint_config
 from .config import has_prettier_config
@@ -36,6 +40,7 @@ from .models import Severity
 __all__ = [
     # Main API
     "check_files",
+    "check_files_async",
     "check_content",
     "TypeScriptChecker",
     # Config
@@ -0,0 +1,112 @@
+"""Per-file check result cache for ts-dev bundle."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from .config import json_loads
+from .models import Issue
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+
+class ResultCache:
+    """Issues found per file by each check, keyed by the file's content digest.
+
+    Entries are only valid for one fingerprint (tool versions, checker config,
+    and project config files); validate() drops them all when it changes.
+    The cache lives in a JSON file and is written back by save().
+    """
+
+    def __init__(self, path: Path):
+        """Initialize cache backed by the given JSON file (read on first use)."""
+        self.path = path
+        self._fingerprint: str | None = None
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        # Content digests by absolute path, reused while the file's (mtime, size) is unchanged
+        self._digests: dict[str, tuple[int, int, str]] = {}
+
+    def validate(self, fingerprint: str) -> None:
+        """Load the cache if needed, discarding entries recorded under another fingerprint."""
+        with self._lock:
+            if self._entries is None:
+                self._load()
+            if self._fingerprint != fingerprint:
+                self._fingerprint = fingerprint
+                self._entries = {}
+                self._dirty = True
+
+    def _load(self) -> None:
+        """Read the cache file; a missing or unreadable file starts an empty cache."""
+        try:
+            data = json_loads(self.path.read_bytes())
+            self._fingerprint = data["fingerprint"]
+            self._entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._fingerprint = None
+            self._entries = {}
+
+    def digest(self, path: str) -> str | None:
+        """Content digest of a file, or None if it cannot be read."""
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(key)
+            known = self._digests.get(key)
+            if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+                return known[2]
+            with open(key, "rb") as f:
+                digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        except OSError:
+            return None
+        self._digests[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def get(self, check: str, path: str, digest: str) -> list[Issue] | None:
+        """Issues a check found in a file with this content, or None if not cached."""
+        entry = (self._entries or {}).get(check, {}).get(os.path.abspath(path))
+        if entry is None or entry["digest"] != digest:
+            return None
+        return [Issue.from_dict(issue) for issue in entry["issues"]]
+
+    def put(self, check: str, path: str, digest: str, issues: list[Issue]) -> None:
+        """Record the issues a check found in a file with this content."""
+        with self._lock:
+            if self._entries is None:
+                return
+            self._entries.setdefault(check, {})[os.path.abspath(path)] = {
+                "digest": digest,
+                "issues": [issue.to_dict() for issue in issues],
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if anything changed, dropping entries for deleted files.
+
+        The file is replaced atomically, so concurrent checkers never read a partial cache.
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            for entries in self._entries.values():
+                for path in [path for path in entries if not os.path.exists(path)]:
+                    del entries[path]
+            data = {"fingerprint": self._fingerprint, "entries": self._entries}
+            encoded = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".results-")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp, self.path)
+            except OSError:
+                return
+            self._dirty = False
@@ -5,22 +5,373 @@ This module contains all the checking logic, shared by:
 - Hook module (automatic checks on file events)
 """
 
-import json
+import asyncio
+import atexit
+import functools
+import hashlib
+import mmap
+import multiprocessing
+import operator
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
+from typing import overload
 
+try:
+    import ijson
+except ImportError:  # Optional: lets ESLint's JSON report be parsed while it is written
+    ijson = None
+
+try:
+    import simdjson
+except ImportError:  # Optional: parses ESLint's JSON report lazily, materializing only the fields read
+    simdjson = None
+
+from .cache import ResultCache
+from .config import _mtime_ns
 from .config import find_project_root
 from .config import has_eslint_config
 from .config import has_typescript_config
+from .config import json_loads
 from .config import load_config
 from .models import CheckConfig
 from .models import CheckResult
 from .models import Issue
 from .models import Severity
 
+# One tsc diagnostic per line: file(line,col): error TSxxxx: message
+_TSC_LINE_RE = re.compile(
+    r"^[^\S\n]*(.+?)\((\d+),(\d+)\):[^\S\n]+(error|warning)[^\S\n]+(TS\d+):[^\S\n]+(.+?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# ESLint numeric severities (2 = error, 1 = warning)
+_ESLINT_SEVERITY = {
+    2: Severity.ERROR,
+    1: Severity.WARNING,
+}
+
+
+def _stream_lines(cmd: list[str], timeout: float = 120) -> Iterator[str]:
+    """Run cmd and yield its stdout lines as they are written (stderr is discarded).
+
+    The process is killed after timeout seconds, and TimeoutExpired is raised
+    once the output it wrote before then has been consumed.
+    """
+    timed_out = threading.Event()
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        assert proc.stdout is not None  # stdout=PIPE
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            yield from proc.stdout
+        except GeneratorExit:
+            # Consumer stopped early; don't wait for the process to finish on its own
+            proc.kill()
+            raise
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+
+def _tool_version(executable: str) -> tuple[int, ...] | None:
+    """Get a tool's version as a tuple of ints (probed once per installed executable)."""
+    try:
+        mtime_ns = os.stat(executable).st_mtime_ns
+    except OSError:
+        return None
+    return _probe_tool_version(executable, mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_tool_version(executable: str, mtime_ns: int) -> tuple[int, ...] | None:
+    """Run executable --version; keyed on its mtime, so an upgraded tool is probed again."""
+    try:
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", result.stdout)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups(default="0"))
+
+
+# Project-root files that change what ESLint or Prettier report; see _result_cache_fingerprint
+_TOOL_CONFIG_PREFIXES = (
+    ".eslintrc",
+    ".eslintignore",
+    "eslint.config",
+    ".prettierrc",
+    ".prettierignore",
+    "prettier.config",
+    ".editorconfig",
+    "package.json",
+)
+
+# Content checks write their temp files to tmpfs when available, so the tools never touch disk
+_CONTENT_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Stub-check workers are started without fork: the check runs on a pool thread, and forking a
+# multi-threaded process can deadlock the child
+_STUB_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Files larger than this (bytes) are memory-mapped for the stub check
+_STUB_MMAP_THRESHOLD = 64 * 1024
+
+# Bytes that need text-mode decoding to scan exactly: carriage returns (universal newlines),
+# the \x1c-\x1f separators (whitespace only to str regexes), and anything non-ASCII
+_TEXT_ONLY_BYTES_RE = re.compile(rb"[\r\x1c-\x1f\x80-\xff]")
+
+
+def _usable_cpu_count() -> int:
+    """Number of CPUs this process may run on (its affinity mask, where the platform has one)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@overload
+def _iter_candidate_lines(
+    content: str, prefilter: re.Pattern[str], newline: str, haystack: str | None = None
+) -> Iterator[tuple[int, str]]: ...
+
+
+@overload
+def _iter_candidate_lines(
+    content: bytes | mmap.mmap, prefilter: re.Pattern[bytes], newline: bytes
+) -> Iterator[tuple[int, bytes]]: ...
+
+
+def _iter_candidate_lines(
+    content: Any, prefilter: re.Pattern[Any], newline: Any, haystack: str | None = None
+) -> Iterator[tuple[int, Any]]:
+    """Yield (line number, line) for each line the prefilter regex matches in content.
+
+    The regex scans the whole text (a str, bytes, or mmap) and each hit is
+    expanded to its line; scanning resumes at the next line, and line numbers
+    are counted incrementally from the previous hit.
+
+    If haystack is given (a lowercased copy of content with the same
+    offsets), it is scanned instead and lines are still sliced from content.
+    """
+    text = content if haystack is None else haystack
+    line_num = 1
+    line_start = 0
+    pos = 0
+    while (match := prefilter.search(text, pos)) is not None:
+        start = text.rfind(newline, 0, match.start()) + 1
+        end = text.find(newline, match.start())
+        if end == -1:
+            end = len(text)
+        line_num += text[line_start:start].count(newline)
+        line_start = start
+        pos = end + 1
+        yield line_num, content[start:end]
+
+
+def _check_file_for_stubs(file_path: Path, config: CheckConfig) -> list[Issue]:
+    """Check a single file for stub patterns.
+
+    A module-level function (as are its helpers) so the stub check can run
+    in worker processes.
+    """
+    issues = []
+    if config.stub_prefilter is None or _is_legitimate_stub_file(file_path):
+        return issues
+
+    # Scripts and tools may legitimately print to the console
+    file_str = str(file_path).lower()
+    allow_console = "/scripts/" in file_str or "/tools/" in file_str
+
+    try:
+        candidates = _stub_candidate_lines(file_path, config)
+    except Exception:
+        return issues
+
+    for line_num, line in candidates:
+        if allow_console and "console." in line:
+            continue
+
+        for pattern, description in config.compiled_stub_patterns:
+            if pattern.search(line):
+                issues.append(
+                    Issue(
+                        file=str(file_path),
+                        line=line_num,
+                        column=1,
+                        code="STUB",
+                        message=f"{description}: {line.strip()[:60]}",
+                        severity=Severity.WARNING,
+                        source="stub-check",
+                        suggestion="Remove placeholder or implement functionality",
+                    )
+                )
+
+    return issues
+
+
+def _stub_candidate_lines(file_path: Path, config: CheckConfig) -> list[tuple[int, str]]:
+    """Find the lines of a file that the combined stub regex matches.
+
+    Large plain-ASCII files are memory-mapped and scanned as bytes, so only
+    candidate lines are copied and decoded; everything else is read as text.
+    """
+    prefilter = config.stub_prefilter
+    if prefilter is None:
+        return []
+
+    bytes_prefilter = config.stub_prefilter_bytes
+    if bytes_prefilter is not None and file_path.stat().st_size > _STUB_MMAP_THRESHOLD:
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _TEXT_ONLY_BYTES_RE.search(mm) is None:
+                return [
+                    (line_num, line.decode("ascii"))
+                    for line_num, line in _iter_candidate_lines(mm, bytes_prefilter, b"\n")
+                ]
+
+    content = file_path.read_text(encoding="utf-8")
+    # Matching lowercased ASCII text case-sensitively is much cheaper than IGNORECASE
+    if config.stub_prefilter_folded is not None and content.isascii():
+        return list(_iter_candidate_lines(content, config.stub_prefilter_folded, "\n", haystack=content.lower()))
+    return list(_iter_candidate_lines(content, prefilter, "\n"))
+
+
+def _is_legitimate_stub_file(file_path: Path) -> bool:
+    """Check if stub patterns are legitimate anywhere in this file."""
+    file_str = str(file_path).lower()
+
+    # Test files are allowed to have mocks and stubs
+    if "test" in file_str or "spec" in file_str or "__tests__" in file_str:
+        return True
+
+    # Config files often have console.log for debugging
+    if file_path.name in ("jest.config.js", "webpack.config.js", "vite.config.ts"):
+        return True
+
+    # Type definition files may have 'any' legitimately
+    return file_path.suffix == ".d.ts"
+
+
+class PersistentToolRunner:
+    """A long-running `tsc --watch` process whose latest diagnostics are served on demand.
+
+    tsc keeps the program in memory between compilations, so a check after an
+    edit only waits for the incremental rebuild instead of a fresh Node start
+    and full type check.
+    """
+
+    # Status lines tsc --watch --pretty false prints around each compilation ("<time> - ...")
+    _STARTED_RE = re.compile(r" - (?:Starting compilation in watch mode|File change detected)")
+    _FINISHED_RE = re.compile(r" - Found \d+ errors?\b")
+
+    # How long to wait for tsc to notice an edit before serving the last result
+    SETTLE_TIME = 1.0
+
+    def __init__(self, cmd: list[str]):
+        """Start the watch process and a thread that collects its output."""
+        self.cmd = cmd
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        self._cond = threading.Condition()
+        self._building = False
+        self._exited = False
+        self._output: str | None = None
+        self._output_started = 0.0  # wall-clock start of the compilation that produced _output
+        threading.Thread(target=self._read_output, daemon=True).start()
+        atexit.register(self.close)
+
+    @property
+    def alive(self) -> bool:
+        """True while the watch process is running."""
+        return not self._exited and self._proc.poll() is None
+
+    @property
+    def has_output(self) -> bool:
+        """True once the watch process has finished at least one compilation."""
+        return self._output is not None
+
+    def _read_output(self) -> None:
+        """Collect diagnostics between compilation start and finish markers."""
+        assert self._proc.stdout is not None
+        lines: list[str] = []
+        started = 0.0
+        for line in self._proc.stdout:
+            if self._STARTED_RE.search(line):
+                lines, started = [], time.time()
+                with self._cond:
+                    self._building = True
+            elif self._FINISHED_RE.search(line):
+                with self._cond:
+                    self._output, self._output_started, self._building = "".join(lines), started, False
+                    self._cond.notify_all()
+            else:
+                lines.append(line)
+
+        with self._cond:
+            self._building, self._exited = False, True
+            self._cond.notify_all()
+
+    def check(self, paths: list[str], timeout: float = 120) -> str | None:
+        """Return tsc's output once it has compiled the current contents of the given files.
+
+        Returns None if the watch process is not running.
+        """
+        newest = max((os.stat(p).st_mtime for p in paths if os.path.isfile(p)), default=0.0)
+        now = time.monotonic()
+        deadline, settle_deadline = now + timeout, now + self.SETTLE_TIME
+
+        with self._cond:
+            while self.alive:
+                idle = self._output is not None and not self._building
+                if idle and self._output_started >= newest:
+                    return self._output
+
+                now = time.monotonic()
+                if now >= deadline:
+                    raise subprocess.TimeoutExpired(self.cmd, timeout)
+                # An edit tsc does not rebuild for (e.g. a file outside the project) never gets a newer result
+                if idle and now >= settle_deadline:
+                    return self._output
+
+                self._cond.wait((settle_deadline if idle else deadline) - now)
+
+        return None
+
+    def close(self) -> None:
+        """Stop the watch process."""
+        atexit.unregister(self.close)
+        if self.alive:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
 
 class TypeScriptChecker:
     """Main checker that orchestrates ESLint, Prettier, tsc, and stub detection."""
@@ -29,15 +380,55 @@ class TypeScriptChecker:
     TS_EXTENSIONS = {".ts", ".tsx", ".mts", ".cts"}
     JS_EXTENSIONS = {".js", ".jsx", ".mjs", ".cjs"}
     ALL_EXTENSIONS = TS_EXTENSIONS | JS_EXTENSIONS
+    _SOURCE_SUFFIXES = tuple(ALL_EXTENSIONS)
+
+    # Version control metadata, never walked for sources regardless of exclude patterns
+    _VCS_DIRS = frozenset({".git", ".hg", ".svn"})
+
+    # Stub-check this many files or more across worker processes. The serial scan runs at
+    # thousands of files per second and starting the pool costs about 0.4s, so smaller
+    # runs are faster in-process
+    STUB_PARALLEL_MIN_FILES = 5000
+
+    # Split Prettier across one process per CPU when given this many files or more
+    PRETTIER_CHUNK_MIN_FILES = 200
 
     def __init__(self, config: CheckConfig | None = None):
         """Initialize checker with optional config."""
-        self.config = config or load_config()
         self.project_root = find_project_root()
+        self.config = config or load_config(self.project_root)
+        # Tools keep their incremental caches under the project's node_modules/.cache
+        self.cache_dir = self.project_root / "node_modules" / ".cache" if self.project_root else None
+
+        # tsc --watch process, started on first use when config.persistent is set
+        self._tsc_watch: PersistentToolRunner | None = None
+        self._tsc_watch_lock = threading.Lock()
+
+        # Resolved tool executables with the node_modules/.bin mtime they were found under;
+        # tools that are not found are looked up again, so installing one mid-session works
+        self._executables: dict[str, tuple[int | None, str]] = {}
+
+        # Per-file ESLint/Prettier results, when config.result_cache is set
+        self._result_cache = (
+            ResultCache(self.cache_dir / "amplifier-ts-check" / "results.json")
+            if self.config.result_cache and self.cache_dir
+            else None
+        )
+
+    def close(self) -> None:
+        """Stop any persistent tool processes started by this checker."""
+        with self._tsc_watch_lock:
+            if self._tsc_watch is not None:
+                self._tsc_watch.close()
+                self._tsc_watch = None
 
     def check_files(self, paths: list[str | Path], fix: bool = False) -> CheckResult:
         """Run all enabled checks on the given paths.
 
+        The checks are independent and mostly wait on tool subprocesses, so they
+        run concurrently in a thread pool. With fix=True, ESLint and Prettier
+        first rewrite files one after the other, then the remaining checks run.
+
         Args:
             paths: Files or directories to check
             fix: If True, auto-fix issues where possible
@@ -49,29 +440,174 @@ class TypeScriptChecker:
             paths = [Path.cwd()]
 
         path_strs = [str(p) for p in paths]
-        results = CheckResult(files_checked=self._count_ts_js_files(path_strs))
+        sources = self._source_files(path_strs)
+        results = CheckResult(files_checked=len(sources[0]) + len(sources[1]))
 
-        if self.config.enable_eslint:
-            eslint_result = self._run_eslint(path_strs, fix=fix)
-            results = results.merge(eslint_result)
+        fixers, checks = self._enabled_checks(path_strs, sources, fix=fix)
 
-        if self.config.enable_prettier:
-            prettier_result = self._run_prettier(path_strs, fix=fix)
-            results = results.merge(prettier_result)
+        for fixer in fixers:
+            results.extend(fixer())
 
-        if self.config.enable_tsc:
-            tsc_result = self._run_tsc(path_strs)
-            results = results.merge(tsc_result)
+        for check_result in self._run_checks(checks):
+            results.extend(check_result)
 
-        if self.config.enable_stub_check:
-            stub_result = self._run_stub_check(path_strs)
-            results = results.merge(stub_result)
+        if self._result_cache is not None:
+            self._result_cache.save()
+
+        return results
+
+    async def check_files_async(self, paths: list[str | Path], fix: bool = False) -> CheckResult:
+        """Run all enabled checks concurrently on the given paths.
+
+        Each check runs in a worker thread, so the ESLint, Prettier, and tsc
+        processes overlap instead of running back to back. With fix=True, ESLint
+        and Prettier first rewrite files one after the other, then the remaining checks run.
+
+        Args:
+            paths: Files or directories to check
+            fix: If True, auto-fix issues where possible
+
+        Returns:
+            CheckResult with all issues found
+        """
+        if not paths:
+            paths = [Path.cwd()]
+
+        path_strs = [str(p) for p in paths]
+        # The directory walk is blocking filesystem work; keep it off the event loop
+        sources = await asyncio.to_thread(self._source_files, path_strs)
+        results = CheckResult(files_checked=len(sources[0]) + len(sources[1]))
+        fixers, checks = self._enabled_checks(path_strs, sources, fix=fix)
+
+        for fixer in fixers:
+            results.extend(await asyncio.to_thread(fixer))
+
+        if self.config.parallel:
+            for check_result in await asyncio.gather(*(asyncio.to_thread(check) for check in checks)):
+                results.extend(check_result)
+        else:
+            for check in checks:
+                results.extend(await asyncio.to_thread(check))
+
+        if self._result_cache is not None:
+            await asyncio.to_thread(self._result_cache.save)
 
         return results
 
+    def _run_checks(self, checks: list[Callable[[], CheckResult]]) -> list[CheckResult]:
+        """Run read-only checks, concurrently in a thread pool unless config.parallel is off."""
+        if self.config.parallel and len(checks) > 1:
+            with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+                return list(pool.map(operator.call, checks))
+        return [check() for check in checks]
+
+    def _enabled_checks(
+        self, paths: list[str], sources: tuple[list[Path], list[Path]] | None = None, fix: bool = False
+    ) -> tuple[list[Callable[[], CheckResult]], list[Callable[[], CheckResult]]]:
+        """Build the enabled checks as zero-argument callables.
+
+        Returns (fixers, checks): fixers rewrite files and must run one at a time
+        before anything else; checks are read-only and can run concurrently.
+        The stub check reuses sources (from _source_files) when given.
+        """
+        fixers: list[Callable[[], CheckResult]] = []
+        checks: list[Callable[[], CheckResult]] = []
+        # Cached results are per file, so only read-only runs on source files given directly use them
+        cached = (
+            self._result_cache is not None
+            and not fix
+            and sources is not None
+            and not sources[1]
+            and len(sources[0]) == len(paths)
+        )
+        if self.config.enable_eslint:
+            if cached:
+                checks.append(functools.partial(self._run_cached, "eslint", paths, self._run_eslint))
+            else:
+                (fixers if fix else checks).append(functools.partial(self._run_eslint, paths, fix=fix))
+        if self.config.enable_prettier:
+            if cached:
+                checks.append(functools.partial(self._run_cached, "prettier", paths, self._run_prettier))
+            else:
+                (fixers if fix else checks).append(functools.partial(self._run_prettier, paths, fix=fix))
+        if self.config.enable_tsc:
+            checks.append(functools.partial(self._run_tsc, paths))
+        if self.config.enable_stub_check:
+            checks.append(functools.partial(self._run_stub_check, paths, sources))
+        return fixers, checks
+
+    def _run_cached(self, check: str, paths: list[str], run: Callable[[list[str]], CheckResult]) -> CheckResult:
+        """Run a per-file check through the result cache.
+
+        Files whose content matches a cached entry reuse its issues; run is
+        called only for the rest, and its issues are cached per file. Nothing
+        is cached from a run that reports tool-level issues (no file), such as
+        a timeout, and issues naming files outside the run are returned as is.
+        """
+        cache = self._result_cache
+        assert cache is not None
+        cache.validate(self._result_cache_fingerprint())
+
+        issues: list[Issue] = []
+        misses: dict[str, str] = {}
+        for path in paths:
+            digest = cache.digest(path) or ""  # Unreadable files are checked but not cached
+            cached = cache.get(check, path, digest) if digest else None
+            if cached is None:
+                misses[path] = digest
+            else:
+                issues.extend(cached)
+        if not misses:
+            return CheckResult(issues=issues, checks_run=[check])
+
+        result = run(list(misses))
+        issues.extend(result.issues)
+
+        if all(issue.file for issue in result.issues):
+            per_file: dict[str, list[Issue]] = {os.path.abspath(path): [] for path in misses}
+            for issue in result.issues:
+                bucket = per_file.get(os.path.abspath(issue.file))
+                if bucket is not None:
+                    bucket.append(issue)
+            for path, digest in misses.items():
+                if digest:
+                    cache.put(check, path, digest, per_file[os.path.abspath(path)])
+
+        return CheckResult(issues=issues, checks_run=result.checks_run)
+
+    def _result_cache_fingerprint(self) -> str:
+        """Digest of what cached results depend on besides file contents.
+
+        Covers the checker config, the ESLint and Prettier executables and
+        versions, and the modification times of tool config files in the
+        project root. (Config files nested deeper in the project are not
+        tracked; clear the cache after changing those.)
+        """
+        parts = [repr(self.config)]
+        for name in ("eslint", "prettier"):
+            executable = self._find_executable(name)
+            parts.append(f"{executable} {_tool_version(executable) if executable else None}")
+        if self.project_root:
+            try:
+                with os.scandir(self.project_root) as entries:
+                    parts.extend(
+                        sorted(
+                            f"{entry.name} {entry.stat().st_mtime_ns}"
+                            for entry in entries
+                            if entry.name.startswith(_TOOL_CONFIG_PREFIXES)
+                        )
+                    )
+            except OSError:
+                pass
+        return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
     def check_content(self, content: str, filename: str = "stdin.ts") -> CheckResult:
         """Check TypeScript/JavaScript content string.
 
+        ESLint and Prettier read the content on stdin. tsc has no stdin mode
+        and the stub check works on files, so those check a temp file, which
+        is only written when either of them is enabled.
+
         Args:
             content: Source code as string
             filename: Virtual filename for error reporting
@@ -82,46 +618,131 @@ class TypeScriptChecker:
         # Determine extension from filename
         ext = Path(filename).suffix or ".ts"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=ext, delete=False) as f:
-            f.write(content)
-            temp_path = f.name
+        checks: list[Callable[[], CheckResult]] = []
+        if self.config.enable_eslint:
+            checks.append(functools.partial(self._run_eslint, [filename], content=content))
+        if self.config.enable_prettier:
+            checks.append(functools.partial(self._run_prettier, [filename], content=content))
+
+        temp_path = None
+        if self.config.enable_tsc or self.config.enable_stub_check:
+            with tempfile.NamedTemporaryFile(mode="w", suffix=ext, dir=_CONTENT_TEMP_DIR, delete=False) as f:
+                f.write(content)
+                temp_path = f.name
+            if self.config.enable_tsc:
+                checks.append(functools.partial(self._run_tsc, [temp_path]))
+            if self.config.enable_stub_check:
+                checks.append(functools.partial(self._run_stub_check, [temp_path]))
 
         try:
-            result = self.check_files([temp_path])
-            # Rewrite paths to use the original filename
-            for issue in result.issues:
-                if issue.file == temp_path:
-                    issue.file = filename
+            result = CheckResult(files_checked=int(ext in self.ALL_EXTENSIONS))
+            for check_result in self._run_checks(checks):
+                result.extend(check_result)
+            # ESLint and Prettier already report the filename; rewrite the temp file's issues to match.
+            # tsc prints paths relative to the working directory and also reports other files in
+            # the project, so paths are compared absolute and only the temp file's issues are renamed
+            if temp_path is not None:
+                result.issues = [
+                    replace(issue, file=filename) if issue.file and os.path.abspath(issue.file) == temp_path else issue
+                    for issue in result.issues
+                ]
             return result
         finally:
-            Path(temp_path).unlink(missing_ok=True)
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
 
     def _count_ts_js_files(self, paths: list[str]) -> int:
         """Count TypeScript/JavaScript files in the given paths."""
-        count = 0
+        given, found = self._source_files(paths)
+        return len(given) + len(found)
+
+    def _source_files(self, paths: list[str]) -> tuple[list[Path], list[Path]]:
+        """List TypeScript/JavaScript files in the given paths.
+
+        Returns (files given directly, files found under directories), kept
+        apart because exclude patterns only apply to the latter. check_files
+        walks once and shares the lists between the file count and the stub check.
+        """
+        given: list[Path] = []
+        found: list[Path] = []
         for path_str in paths:
             path = Path(path_str)
             if path.is_file() and path.suffix in self.ALL_EXTENSIONS:
-                count += 1
+                given.append(path)
             elif path.is_dir():
-                for ext in self.ALL_EXTENSIONS:
-                    count += len(list(path.rglob(f"*{ext}")))
-        return count
+                found.extend(self._iter_source_files(path))
+        return given, found
+
+    def _iter_source_files(self, root: Path) -> Iterator[Path]:
+        """Yield TypeScript/JavaScript files under a directory in a single walk, skipping excluded directories."""
+        for dirpath, dirnames, filenames in os.walk(root):
+            self._prune_excluded_dirs(dirpath, dirnames)
+            for filename in filenames:
+                if filename.endswith(self._SOURCE_SUFFIXES):
+                    yield Path(dirpath, filename)
+
+    def _prune_excluded_dirs(self, dirpath: str, dirnames: list[str]) -> None:
+        """Drop VCS and excluded directories from an os.walk dirnames list, in place.
+
+        Plain "name/**" patterns are checked by name; everything else goes
+        through the exclude regex with a trailing slash, which matches exactly
+        when every file below the directory would be excluded anyway.
+        """
+        if not dirnames:
+            return
+        dirnames[:] = [name for name in dirnames if name not in self._VCS_DIRS]
+        exclude_re = self.config.exclude_re
+        if exclude_re is None:
+            return
+        excluded_names = self.config.exclude_dir_names
+        prefix = Path(dirpath).as_posix()
+        dirnames[:] = [
+            name for name in dirnames if name not in excluded_names and exclude_re.search(f"{prefix}/{name}/") is None
+        ]
+
+    def _path_chunks(self, paths: list[str], min_files: int) -> list[list[str]]:
+        """Split files into one group per CPU by path hash; [] for few files, one CPU, or any directory."""
+        workers = _usable_cpu_count()
+        if workers < 2 or len(paths) < min_files or any(os.path.isdir(path) for path in paths):
+            return []
+        chunks: list[list[str]] = [[] for _ in range(workers)]
+        for path in paths:
+            chunks[zlib.crc32(os.fsencode(path)) % workers].append(path)
+        return chunks
 
     def _find_executable(self, name: str) -> str | None:
-        """Find executable, preferring local node_modules."""
+        """Find executable, preferring local node_modules.
+
+        Found executables are cached on the checker until node_modules/.bin
+        changes (a package installed or removed); misses are not cached.
+        """
+        local_bin_dir = self.project_root / "node_modules" / ".bin" if self.project_root else None
+        bin_mtime_ns = _mtime_ns(local_bin_dir) if local_bin_dir else None
+        cached = self._executables.get(name)
+        if cached is not None and cached[0] == bin_mtime_ns:
+            return cached[1]
+
+        executable = None
+
         # Check local node_modules/.bin first
-        if self.project_root:
-            local_bin = self.project_root / "node_modules" / ".bin" / name
+        if local_bin_dir and bin_mtime_ns is not None:
+            local_bin = local_bin_dir / name
             if local_bin.exists():
-                return str(local_bin)
+                executable = str(local_bin)
 
         # Check global
-        return shutil.which(name)
+        executable = executable or shutil.which(name)
+        if executable:
+            self._executables[name] = (bin_mtime_ns, executable)
+        return executable
 
-    def _run_eslint(self, paths: list[str], fix: bool = False) -> CheckResult:
-        """Run ESLint check."""
-        eslint = self._find_executable("eslint")
+    def _run_eslint(self, paths: list[str], fix: bool = False, content: str | None = None) -> CheckResult:
+        """Run ESLint check.
+
+        If content is given, it is piped to ESLint on stdin and linted as if it
+        were the single file in paths; its issues are reported under that name.
+        """
+        eslint = (self.config.eslint_daemon and self._find_executable("eslint_d")) or self._find_executable("eslint")
 
         if not eslint:
             return CheckResult(
@@ -143,15 +764,42 @@ class TypeScriptChecker:
         if fix:
             cmd.append("--fix")
 
+        # Flags depend on the ESLint version; eslint_d reports its own, so ask eslint itself
+        plain_eslint = self._find_executable("eslint")
+        version = _tool_version(plain_eslint) if plain_eslint else None
+
+        # Reuse lint results for unchanged files across runs (default location without a project root).
+        # Hash contents rather than trusting mtimes, which git checkouts and rebases touch (ESLint 7.21+)
+        if self.config.eslint_cache and content is None:
+            cmd.append("--cache")
+            if version and version >= (7, 21):
+                cmd.extend(["--cache-strategy", "content"])
+            if self.cache_dir:
+                cmd.extend(["--cache-location", f"{self.cache_dir / 'eslint'}/"])
+
         # Add default config if project doesn't have one
         if not has_eslint_config(self.project_root):
             # Use basic recommended rules
             cmd.extend(["--no-eslintrc", "--env", "browser,node,es2022"])
 
-        cmd.extend(paths)
+        # Let ESLint lint files on multiple threads (--concurrency needs ESLint 9.34+)
+        if self.config.eslint_concurrency != "off" and version and version >= (9, 34) and content is None:
+            cmd.extend(["--concurrency", self.config.eslint_concurrency])
+
+        if content is not None:
+            cmd.extend(["--stdin", "--stdin-filename", paths[0]])
+        else:
+            cmd.extend(paths)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if ijson is not None and content is None:
+                issues = self._stream_eslint(cmd)
+            else:
+                result = subprocess.run(cmd, input=content, capture_output=True, text=True, timeout=120)
+                issues = self._parse_eslint_report(result.stdout)
+                if content is not None:
+                    # ESLint reports the stdin filename resolved against the working directory
+                    issues = [replace(issue, file=paths[0]) for issue in issues]
         except subprocess.TimeoutExpired:
             return CheckResult(
                 issues=[
@@ -183,40 +831,90 @@ class TypeScriptChecker:
                 checks_run=["eslint"],
             )
 
-        issues = []
-        if result.stdout.strip():
+        return CheckResult(issues=issues, checks_run=["eslint"])
+
+    def _stream_eslint(self, cmd: list[str]) -> list[Issue]:
+        """Run ESLint and build issues from its JSON report while it is still being written.
+
+        Only one file's results are held at a time, instead of the whole report
+        as text and then as parsed JSON. Requires ijson.
+        """
+        if ijson is None:
+            raise RuntimeError("Streaming the ESLint report requires ijson")
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            timer = threading.Timer(120, kill)
+            timer.start()
             try:
-                eslint_output = json.loads(result.stdout)
-                for file_result in eslint_output:
-                    file_path = file_result.get("filePath", "")
-                    for msg in file_result.get("messages", []):
-                        severity_map = {
-                            2: Severity.ERROR,
-                            1: Severity.WARNING,
-                        }
-                        severity = severity_map.get(msg.get("severity", 1), Severity.WARNING)
+                issues = self._eslint_issues(ijson.items(proc.stdout, "item"))
+            except ijson.JSONError:
+                issues = []
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 120)
+        return issues
 
-                        issues.append(
-                            Issue(
-                                file=file_path,
-                                line=msg.get("line", 0),
-                                column=msg.get("column", 0),
-                                code=msg.get("ruleId") or "eslint",
-                                message=msg.get("message", ""),
-                                severity=severity,
-                                source="eslint",
-                                suggestion=msg.get("fix", {}).get("text") if msg.get("fix") else None,
-                                end_line=msg.get("endLine"),
-                                end_column=msg.get("endColumn"),
-                            )
-                        )
-            except json.JSONDecodeError:
-                pass
+    def _parse_eslint_report(self, output: str) -> list[Issue]:
+        """Build issues from a complete ESLint JSON report."""
+        if not output.strip():
+            return []
+        try:
+            if simdjson is not None:
+                # A new parser per report: reusing one invalidates its previous document,
+                # and reports may be parsed on several threads at once
+                report = simdjson.Parser().parse(output.encode())
+                return self._eslint_issues(report) if isinstance(report, simdjson.Array) else []
+            return self._eslint_issues(json_loads(output))
+        except ValueError:  # json.JSONDecodeError, or simdjson's parse errors
+            return []
+
+    def _eslint_issues(self, file_results: Iterable[Any]) -> list[Issue]:
+        """Convert ESLint per-file results into issues.
+
+        Results are mappings: dicts from json or ijson, or simdjson Objects.
+        """
+        issues = []
+        for file_result in file_results:
+            file_path = file_result.get("filePath", "")
+            for msg in file_result.get("messages", []):
+                severity = _ESLINT_SEVERITY.get(msg.get("severity", 1), Severity.WARNING)
 
-        return CheckResult(issues=issues, checks_run=["eslint"])
+                issues.append(
+                    Issue(
+                        file=file_path,
+                        line=msg.get("line", 0),
+                        column=msg.get("column", 0),
+                        code=msg.get("ruleId") or "eslint",
+                        message=msg.get("message", ""),
+                        severity=severity,
+                        source="eslint",
+                        suggestion=msg.get("fix", {}).get("text") if msg.get("fix") else None,
+                        end_line=msg.get("endLine"),
+                        end_column=msg.get("endColumn"),
+                    )
+                )
+        return issues
 
-    def _run_prettier(self, paths: list[str], fix: bool = False) -> CheckResult:
-        """Run Prettier format check."""
+    def _run_prettier(
+        self,
+        paths: list[str],
+        fix: bool = False,
+        content: str | None = None,
+    ) -> CheckResult:
+        """Run Prettier format check.
+
+        Long lists of files are split into one Prettier process per CPU (see
+        _path_chunks).
+        If content is given, it is piped to Prettier on stdin and checked as
+        if it were the single file in paths.
+        """
         prettier = self._find_executable("prettier")
 
         if not prettier:
@@ -240,11 +938,34 @@ class TypeScriptChecker:
         else:
             cmd = [prettier, "--check"]
 
-        # Add file extensions
-        cmd.extend(paths)
+        # Skip unchanged files across runs, keyed on file contents rather than mtimes (needs Prettier 2.7+)
+        cache_location = None
+        version = _tool_version(prettier)
+        if version and version >= (2, 7):
+            cmd.extend(["--cache", "--cache-strategy", "content"])
+            if self.cache_dir:
+                cache_location = str(self.cache_dir / "prettier" / ".prettier-cache")
+
+        # Chunked runs each keep their own cache file (a file always lands in the same chunk)
+        if content is not None:
+            # Prettier prints the formatted text, compared with the content below
+            runs = [[prettier, "--stdin-filepath", paths[0]]]
+        elif chunks := self._path_chunks(paths, self.PRETTIER_CHUNK_MIN_FILES):
+            runs = [
+                [*cmd, *(["--cache-location", f"{cache_location}-{i}"] if cache_location else []), *chunk]
+                for i, chunk in enumerate(chunks)
+                if chunk
+            ]
+        else:
+            runs = [[*cmd, *(["--cache-location", cache_location] if cache_location else []), *paths]]
+        run = functools.partial(subprocess.run, input=content, capture_output=True, text=True, timeout=120)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if len(runs) == 1:
+                results = [run(runs[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(runs)) as pool:
+                    results = list(pool.map(run, runs))
         except subprocess.TimeoutExpired:
             return CheckResult(
                 issues=[
@@ -277,16 +998,13 @@ class TypeScriptChecker:
             )
 
         issues = []
-        if result.returncode != 0 and not fix:
-            # Parse stderr for files that would be reformatted
-            # Prettier outputs: "Checking formatting...\n[warn] file.ts\n..."
-            for line in result.stdout.split("\n"):
-                line = line.strip()
-                if line.startswith("[warn]"):
-                    file_path = line[6:].strip()
+        for result in results:
+            if content is not None:
+                # A failed run (e.g. a syntax error) is not a formatting issue, as with --check
+                if result.returncode == 0 and result.stdout != content:
                     issues.append(
                         Issue(
-                            file=file_path,
+                            file=paths[0],
                             line=1,
                             column=1,
                             code="FORMAT",
@@ -296,23 +1014,60 @@ class TypeScriptChecker:
                             suggestion="Run with --fix to auto-format",
                         )
                     )
-                elif line and not line.startswith("Checking") and Path(line).suffix in self.ALL_EXTENSIONS:
-                    # Sometimes prettier just outputs the filename
-                    issues.append(
-                        Issue(
-                            file=line,
-                            line=1,
-                            column=1,
-                            code="FORMAT",
-                            message="File would be reformatted",
-                            severity=Severity.WARNING,
-                            source="prettier",
-                            suggestion="Run with --fix to auto-format",
+            elif result.returncode != 0 and not fix:
+                # Parse stderr for files that would be reformatted
+                # Prettier outputs: "Checking formatting...\n[warn] file.ts\n..."
+                for line in result.stdout.split("\n"):
+                    line = line.strip()
+                    if line.startswith("[warn]"):
+                        file_path = line[6:].strip()
+                        # Every run (one per chunk) ends with a summary line, not a file name
+                        if file_path.startswith("Code style issues"):
+                            continue
+                        issues.append(
+                            Issue(
+                                file=file_path,
+                                line=1,
+                                column=1,
+                                code="FORMAT",
+                                message="File would be reformatted",
+                                severity=Severity.WARNING,
+                                source="prettier",
+                                suggestion="Run with --fix to auto-format",
+                            )
+                        )
+                    elif line and not line.startswith("Checking") and Path(line).suffix in self.ALL_EXTENSIONS:
+                        # Sometimes prettier just outputs the filename
+                        issues.append(
+                            Issue(
+                                file=line,
+                                line=1,
+                                column=1,
+                                code="FORMAT",
+                                message="File would be reformatted",
+                                severity=Severity.WARNING,
+                                source="prettier",
+                                suggestion="Run with --fix to auto-format",
+                            )
                         )
-                    )
 
         return CheckResult(issues=issues, checks_run=["prettier"])
 
+    def _tsc_watcher(self, cmd: list[str]) -> PersistentToolRunner:
+        """Get the tsc --watch process for cmd, starting it if needed.
+
+        A watcher that exited without ever finishing a compilation (e.g. a tsc
+        that cannot watch) is not restarted; its check() returns None and
+        callers fall back to one-shot runs.
+        """
+        with self._tsc_watch_lock:
+            watcher = self._tsc_watch
+            if watcher is None or watcher.cmd != cmd or (not watcher.alive and watcher.has_output):
+                if watcher is not None:
+                    watcher.close()
+                watcher = self._tsc_watch = PersistentToolRunner(cmd)
+            return watcher
+
     def _run_tsc(self, paths: list[str]) -> CheckResult:
         """Run TypeScript type checking."""
         # Only run on TypeScript files or if project has tsconfig
@@ -342,16 +1097,29 @@ class TypeScriptChecker:
         # Use --noEmit to just check types without generating output
         cmd = [tsc, "--noEmit", "--pretty", "false"]
 
+        watch_cmd = None
+
         # If project has tsconfig, use it
         if self.project_root and has_typescript_config(self.project_root):
             cmd.extend(["--project", str(self.project_root / "tsconfig.json")])
+            if self.config.persistent:
+                watch_cmd = [tsc, "--watch", "--preserveWatchOutput", *cmd[1:]]
+            # Reuse the previous program state across runs (--incremental with --noEmit needs tsc 4.0+)
+            version = _tool_version(tsc)
+            if self.cache_dir and version and version >= (4, 0):
+                cmd.extend(["--incremental", "--tsBuildInfoFile", str(self.cache_dir / "tsc" / "tsconfig.tsbuildinfo")])
         else:
             # Basic config for checking
             cmd.extend(["--allowJs", "--checkJs", "--strict"])
             cmd.extend(paths)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            output = self._tsc_watcher(watch_cmd).check(paths) if watch_cmd else None
+            if output is not None:
+                issues = self._tsc_issues(_TSC_LINE_RE.finditer(output))
+            else:
+                # Parse diagnostics as tsc prints them instead of buffering all of its output
+                issues = self._tsc_issues(filter(None, map(_TSC_LINE_RE.match, _stream_lines(cmd))))
         except subprocess.TimeoutExpired:
             return CheckResult(
                 issues=[
@@ -383,116 +1151,53 @@ class TypeScriptChecker:
                 checks_run=["tsc"],
             )
 
-        issues = []
-        # Parse tsc output: file(line,col): error TSxxxx: message
-        tsc_pattern = re.compile(r"(.+?)\((\d+),(\d+)\):\s+(error|warning)\s+(TS\d+):\s+(.+)")
-
-        for line in result.stdout.split("\n"):
-            match = tsc_pattern.match(line.strip())
-            if match:
-                file_path, line_num, col, severity_str, code, message = match.groups()
-                severity = Severity.ERROR if severity_str == "error" else Severity.WARNING
+        return CheckResult(issues=issues, checks_run=["tsc"])
 
-                issues.append(
-                    Issue(
-                        file=file_path,
-                        line=int(line_num),
-                        column=int(col),
-                        code=code,
-                        message=message,
-                        severity=severity,
-                        source="tsc",
-                    )
+    def _tsc_issues(self, matches: Iterable[re.Match[str]]) -> list[Issue]:
+        """Convert tsc diagnostic line matches (from _TSC_LINE_RE) into issues."""
+        issues = []
+        for match in matches:
+            file_path, line_num, col, severity_str, code, message = match.groups()
+            severity = Severity.ERROR if severity_str == "error" else Severity.WARNING
+
+            issues.append(
+                Issue(
+                    file=file_path,
+                    line=int(line_num),
+                    column=int(col),
+                    code=code,
+                    message=message,
+                    severity=severity,
+                    source="tsc",
                 )
+            )
 
-        return CheckResult(issues=issues, checks_run=["tsc"])
+        return issues
 
-    def _run_stub_check(self, paths: list[str]) -> CheckResult:
+    def _run_stub_check(self, paths: list[str], sources: tuple[list[Path], list[Path]] | None = None) -> CheckResult:
         """Check for TODOs, stubs, and placeholder code."""
-        issues = []
+        given, found = sources if sources is not None else self._source_files(paths)
+        files = given + [ts_file for ts_file in found if not self._should_exclude(ts_file)]
 
-        for path_str in paths:
-            path = Path(path_str)
-            if path.is_file() and path.suffix in self.ALL_EXTENSIONS:
-                issues.extend(self._check_file_for_stubs(path))
-            elif path.is_dir():
-                for ext in self.ALL_EXTENSIONS:
-                    for ts_file in path.rglob(f"*{ext}"):
-                        if self._should_exclude(ts_file):
-                            continue
-                        issues.extend(self._check_file_for_stubs(ts_file))
+        check_file = functools.partial(_check_file_for_stubs, config=self.config)
+        workers = _usable_cpu_count()
+        if self.config.stub_check_parallel and workers > 1 and len(files) >= self.STUB_PARALLEL_MIN_FILES:
+            # Pure CPU work on independent files; below the threshold, process startup costs more than it saves
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_STUB_POOL_CONTEXT) as pool:
+                    file_issues = list(pool.map(check_file, files, chunksize=64))
+            except (OSError, BrokenProcessPool):
+                file_issues = list(map(check_file, files))
+        else:
+            file_issues = list(map(check_file, files))
 
+        issues = [issue for issues in file_issues for issue in issues]
         return CheckResult(issues=issues, checks_run=["stub-check"])
 
     def _should_exclude(self, path: Path) -> bool:
         """Check if path matches any exclude pattern."""
-        path_str = str(path)
-        for pattern in self.config.exclude_patterns:
-            if pattern.endswith("/**"):
-                dir_pattern = pattern[:-3]
-                if dir_pattern in path_str:
-                    return True
-            elif pattern.startswith("*."):
-                if path.suffix == pattern[1:]:
-                    return True
-            elif pattern in path_str:
-                return True
-        return False
-
-    def _check_file_for_stubs(self, file_path: Path) -> list[Issue]:
-        """Check a single file for stub patterns."""
-        issues = []
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-        except Exception:
-            return issues
-
-        for line_num, line in enumerate(lines, 1):
-            for pattern, description in self.config.stub_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    # Check for legitimate patterns
-                    if self._is_legitimate_pattern(file_path, line_num, line, lines):
-                        continue
-
-                    issues.append(
-                        Issue(
-                            file=str(file_path),
-                            line=line_num,
-                            column=1,
-                            code="STUB",
-                            message=f"{description}: {line.strip()[:60]}",
-                            severity=Severity.WARNING,
-                            source="stub-check",
-                            suggestion="Remove placeholder or implement functionality",
-                        )
-                    )
-
-        return issues
-
-    def _is_legitimate_pattern(self, file_path: Path, line_num: int, line: str, lines: list[str]) -> bool:
-        """Check if a stub pattern is actually legitimate."""
-        file_str = str(file_path).lower()
-
-        # Test files are allowed to have mocks and stubs
-        if "test" in file_str or "spec" in file_str or "__tests__" in file_str:
-            return True
-
-        # Config files often have console.log for debugging
-        if file_path.name in ("jest.config.js", "webpack.config.js", "vite.config.ts"):
-            return True
-
-        # Type definition files may have 'any' legitimately
-        if file_path.suffix == ".d.ts":
-            return True
-
-        # Console in scripts/tools directories
-        if "/scripts/" in file_str or "/tools/" in file_str:
-            if "console." in line:
-                return True
-
-        return False
+        exclude_re = self.config.exclude_re
+        return exclude_re is not None and exclude_re.search(path.as_posix()) is not None
 
 
 # Convenience functions for direct use
@@ -511,6 +1216,23 @@ def check_files(paths: list[str | Path], config: CheckConfig | None = None, fix:
     return checker.check_files(paths, fix=fix)
 
 
+async def check_files_async(
+    paths: list[str | Path], config: CheckConfig | None = None, fix: bool = False
+) -> CheckResult:
+    """Check TypeScript/JavaScript files for issues, running the checks concurrently.
+
+    Args:
+        paths: Files or directories to check
+        config: Optional config (defaults loaded from package.json)
+        fix: If True, auto-fix issues where possible
+
+    Returns:
+        CheckResult with issues found
+    """
+    checker = TypeScriptChecker(config)
+    return await checker.check_files_async(paths, fix=fix)
+
+
 def check_content(content: str, filename: str = "stdin.ts", config: CheckConfig | None = None) -> CheckResult:
     """Check TypeScript/JavaScript content string.
 
@@ -1,23 +1,80 @@
 """Configuration loading for ts-dev bundle."""
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
+
 from .models import CheckConfig
 
+# Config files that configure ESLint or Prettier when present in the project root
+_ESLINT_CONFIG_NAMES = (
+    ".eslintrc",
+    ".eslintrc.js",
+    ".eslintrc.cjs",
+    ".eslintrc.json",
+    ".eslintrc.yaml",
+    ".eslintrc.yml",
+    "eslint.config.js",
+    "eslint.config.mjs",
+    "eslint.config.cjs",
+)
+_PRETTIER_CONFIG_NAMES = (
+    ".prettierrc",
+    ".prettierrc.js",
+    ".prettierrc.cjs",
+    ".prettierrc.json",
+    ".prettierrc.yaml",
+    ".prettierrc.yml",
+    ".prettierrc.toml",
+    "prettier.config.js",
+    "prettier.config.cjs",
+)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of a path in nanoseconds, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 def find_project_root(start_path: Path | None = None) -> Path | None:
     """Find project root by looking for package.json or tsconfig.json."""
-    current = start_path or Path.cwd()
+    try:
+        return _find_project_root(start_path or Path.cwd())
+    except FileNotFoundError:
+        return None
 
+
+@functools.lru_cache(maxsize=256)
+def _find_project_root(current: Path) -> Path:
+    """Walk up from a directory to the project root (memoized per start directory).
+
+    Raises FileNotFoundError when there is none; lru_cache does not cache
+    exceptions, so a project created later in the session is still found.
+    """
     for path in [current] + list(current.parents):
         if (path / "package.json").exists():
             return path
         if (path / "tsconfig.json").exists():
             return path
 
-    return None
+    raise FileNotFoundError(f"No package.json or tsconfig.json above {current}")
 
 
 def load_config(project_root: Path | None = None) -> CheckConfig:
@@ -33,12 +90,18 @@ def load_config(project_root: Path | None = None) -> CheckConfig:
         return CheckConfig()
 
     package_json = project_root / "package.json"
-    if not package_json.exists():
+    # Each caller gets its own copy, so mutating it cannot change the cached config
+    return copy.deepcopy(_load_package_config(package_json, _mtime_ns(package_json)))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_package_config(package_json: Path, mtime_ns: int | None) -> CheckConfig:
+    """Parse config from package.json; keyed on its mtime so edits are picked up."""
+    if mtime_ns is None:
         return CheckConfig()
 
     try:
-        with open(package_json) as f:
-            pkg: dict[str, Any] = json.load(f)
+        pkg: dict[str, Any] = json_loads(package_json.read_bytes())
 
         config_data: dict[str, Any] = pkg.get("amplifier-ts-dev", {})
         return CheckConfig.from_dict(config_data)
@@ -51,19 +114,17 @@ def has_eslint_config(project_root: Path | None = None) -> bool:
     if project_root is None:
         project_root = find_project_root() or Path.cwd()
 
-    eslint_configs = [
-        ".eslintrc",
-        ".eslintrc.js",
-        ".eslintrc.cjs",
-        ".eslintrc.json",
-        ".eslintrc.yaml",
-        ".eslintrc.yml",
-        "eslint.config.js",
-        "eslint.config.mjs",
-        "eslint.config.cjs",
-    ]
-
-    for config in eslint_configs:
+    return _has_eslint_config(project_root, _mtime_ns(project_root), _mtime_ns(project_root / "package.json"))
+
+
+@functools.lru_cache(maxsize=64)
+def _has_eslint_config(project_root: Path, root_mtime_ns: int | None, package_json_mtime_ns: int | None) -> bool:
+    """Look for ESLint config in a project.
+
+    Keyed on the mtimes of the project directory (config files added or removed)
+    and of package.json (eslintConfig edited), so cached answers stay current.
+    """
+    for config in _ESLINT_CONFIG_NAMES:
         if (project_root / config).exists():
             return True
 
@@ -71,8 +132,7 @@ def has_eslint_config(project_root: Path | None = None) -> bool:
     package_json = project_root / "package.json"
     if package_json.exists():
         try:
-            with open(package_json) as f:
-                pkg: dict[str, Any] = json.load(f)
+            pkg: dict[str, Any] = json_loads(package_json.read_bytes())
             if "eslintConfig" in pkg:
                 return True
         except (json.JSONDecodeError, OSError):
@@ -86,19 +146,13 @@ def has_prettier_config(project_root: Path | None = None) -> bool:
     if project_root is None:
         project_root = find_project_root() or Path.cwd()
 
-    prettier_configs = [
-        ".prettierrc",
-        ".prettierrc.js",
-        ".prettierrc.cjs",
-        ".prettierrc.json",
-        ".prettierrc.yaml",
-        ".prettierrc.yml",
-        ".prettierrc.toml",
-        "prettier.config.js",
-        "prettier.config.cjs",
-    ]
-
-    for config in prettier_configs:
+    return _has_prettier_config(project_root, _mtime_ns(project_root), _mtime_ns(project_root / "package.json"))
+
+
+@functools.lru_cache(maxsize=64)
+def _has_prettier_config(project_root: Path, root_mtime_ns: int | None, package_json_mtime_ns: int | None) -> bool:
+    """Look for Prettier config in a project (memoized like _has_eslint_config)."""
+    for config in _PRETTIER_CONFIG_NAMES:
         if (project_root / config).exists():
             return True
 
@@ -106,8 +160,7 @@ def has_prettier_config(project_root: Path | None = None) -> bool:
     package_json = project_root / "package.json"
     if package_json.exists():
         try:
-            with open(package_json) as f:
-                pkg: dict[str, Any] = json.load(f)
+            pkg: dict[str, Any] = json_loads(package_json.read_bytes())
             if "prettier" in pkg:
                 return True
         except (json.JSONDecodeError, OSError):
@@ -1,20 +1,26 @@
 """Data models for TypeScript/JavaScript code checking."""
 
+import re
 from dataclasses import dataclass
 from dataclasses import field
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 
-class Severity(Enum):
-    """Issue severity levels."""
+class Severity(IntEnum):
+    """Issue severity levels, ordered from most to least severe."""
 
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in output ("error", "warning", "info")."""
+        return self.name.lower()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     """A single code quality issue."""
 
@@ -29,6 +35,10 @@ class Issue:
     end_line: int | None = None
     end_column: int | None = None
 
+    def format(self) -> str:
+        """Format as a single "file:line:column: [code] message" line."""
+        return f"{self.file}:{self.line}:{self.column}: [{self.code}] {self.message}"
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -37,15 +47,20 @@ class Issue:
             "column": self.column,
             "code": self.code,
             "message": self.message,
-            "severity": self.severity.value,
+            "severity": self.severity.label,
             "source": self.source,
             "suggestion": self.suggestion,
             "end_line": self.end_line,
             "end_column": self.end_column,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Issue":
+        """Create an issue from to_dict output."""
+        return cls(**{**data, "severity": Severity[data["severity"].upper()]})
+
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of running code checks."""
 
@@ -63,20 +78,43 @@ class CheckResult:
         """True if no issues at all."""
         return len(self.issues) == 0
 
+    @property
+    def issues_by_severity(self) -> dict[Severity, list[Issue]]:
+        """Issues grouped by severity, built in a single pass."""
+        buckets: dict[Severity, list[Issue]] = {severity: [] for severity in Severity}
+        for issue in self.issues:
+            buckets[issue.severity].append(issue)
+        return buckets
+
     def merge(self, other: "CheckResult") -> "CheckResult":
-        """Merge another result into this one."""
-        return CheckResult(
-            issues=self.issues + other.issues,
-            files_checked=max(self.files_checked, other.files_checked),
-            checks_run=list(set(self.checks_run + other.checks_run)),
+        """Merge another result into this one, returning a new result.
+
+        Kept for API compatibility; folding several results together is
+        cheaper with extend, which does not copy what is already accumulated.
+        """
+        merged = CheckResult(
+            issues=list(self.issues), files_checked=self.files_checked, checks_run=list(self.checks_run)
         )
+        merged.extend(other)
+        return merged
+
+    def extend(self, other: "CheckResult") -> None:
+        """Add another result's issues and checks to this one in place.
+
+        Unlike merge, this copies nothing already accumulated, so folding
+        several check results together stays linear in the total issue count.
+        """
+        self.issues.extend(other.issues)
+        self.files_checked = max(self.files_checked, other.files_checked)
+        self.checks_run.extend(check for check in other.checks_run if check not in self.checks_run)
 
     def to_tool_output(self) -> dict[str, Any]:
         """Format for tool output."""
         # Group issues by severity
-        errors = [i for i in self.issues if i.severity == Severity.ERROR]
-        warnings = [i for i in self.issues if i.severity == Severity.WARNING]
-        infos = [i for i in self.issues if i.severity == Severity.INFO]
+        by_severity = self.issues_by_severity
+        errors = by_severity[Severity.ERROR]
+        warnings = by_severity[Severity.WARNING]
+        infos = by_severity[Severity.INFO]
 
         summary_parts = []
         if errors:
@@ -103,17 +141,45 @@ class CheckResult:
             "info_count": len(infos),
         }
 
+    def format_issues(self) -> str:
+        """Format issues one per line, indented, for hook injection."""
+        return "\n".join(f"  {i.format()}" for i in self.issues)
+
     def to_hook_output(self) -> dict[str, Any]:
         """Format for hook injection."""
-        issues_text = "\n".join(f"  {i.file}:{i.line}:{i.column}: [{i.code}] {i.message}" for i in self.issues)
         return {
             "summary": f"Found {len(self.issues)} issue(s)",
-            "issues_text": issues_text,
+            "issues_text": self.format_issues(),
             "has_errors": not self.success,
         }
 
 
-@dataclass
+def _glob_regex(glob: str) -> str:
+    """Translate a path glob fragment to regex ("**/" spans directories, "*" and "?" stay within one)."""
+    return (
+        re.escape(glob)
+        .replace(r"\*\*/", "(?:.*/)?")
+        .replace(r"\*\*", ".*")
+        .replace(r"\*", "[^/]*")
+        .replace(r"\?", "[^/]")
+    )
+
+
+def _exclude_regex(pattern: str) -> str:
+    """Translate an exclude pattern to a regex searched against a POSIX path.
+
+    "dir/**" matches a whole directory component anywhere in the path,
+    "*.ext" (including multi-part suffixes like "*.min.js") matches the end
+    of the path, and anything else matches as a substring.
+    """
+    if pattern.endswith("/**"):
+        return f"(?:^|/){_glob_regex(pattern[:-3])}/"
+    if pattern.startswith("*.") and not any(c in pattern[1:] for c in "*?/"):
+        return f"{re.escape(pattern[1:])}$"
+    return _glob_regex(pattern)
+
+
+@dataclass(slots=True)
 class CheckConfig:
     """Configuration for the checker."""
 
@@ -122,6 +188,27 @@ class CheckConfig:
     enable_tsc: bool = True
     enable_stub_check: bool = True
 
+    # Run the read-only checks concurrently (one thread per check)
+    parallel: bool = True
+
+    # Stub-check large file sets across worker processes (one per CPU)
+    stub_check_parallel: bool = True
+
+    # ESLint --concurrency value: "auto", "off", or a thread count (ignored before ESLint 9.34)
+    eslint_concurrency: str = "auto"
+
+    # Pass --cache to ESLint so unchanged files are not re-linted
+    eslint_cache: bool = True
+
+    # Run ESLint through eslint_d when it is installed, reusing its warm Node process between checks
+    eslint_daemon: bool = True
+
+    # Keep a tsc --watch process alive between checks (for long-lived hosts like hooks)
+    persistent: bool = False
+
+    # Reuse ESLint and Prettier results for files whose content has not changed since the last check
+    result_cache: bool = False
+
     # Paths to exclude
     exclude_patterns: list[str] = field(
         default_factory=lambda: [
@@ -152,6 +239,47 @@ class CheckConfig:
         ]
     )
 
+    # Compiled from stub_patterns in __post_init__
+    compiled_stub_patterns: list[tuple[re.Pattern[str], str]] = field(init=False, repr=False, compare=False)
+    stub_prefilter: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    stub_prefilter_bytes: re.Pattern[bytes] | None = field(init=False, repr=False, compare=False)
+    stub_prefilter_folded: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    # Compiled from exclude_patterns in __post_init__
+    exclude_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+    exclude_dir_names: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile stub and exclude patterns once.
+
+        Stub patterns also get one combined alternation that finds candidate
+        lines in a single pass; exclude patterns become a single regex.
+        """
+        self.compiled_stub_patterns = [
+            (re.compile(pattern, re.IGNORECASE), description) for pattern, description in self.stub_patterns
+        ]
+        combined = "|".join(f"(?:{pattern})" for pattern, _ in self.stub_patterns)
+        self.stub_prefilter = re.compile(combined, re.IGNORECASE) if self.stub_patterns else None
+        # Same alternation for scanning raw bytes of ASCII files; only exact for ASCII patterns
+        self.stub_prefilter_bytes = (
+            re.compile(combined.encode("ascii"), re.IGNORECASE) if self.stub_patterns and combined.isascii() else None
+        )
+        # Lowercased, case-sensitive alternation for scanning lowercased ASCII text (no per-char case
+        # folding); only when lowercasing keeps the regex's meaning (no uppercase escapes like \S)
+        foldable = self.stub_patterns and combined.isascii() and not re.search(r"\\[A-Z]", combined)
+        self.stub_prefilter_folded = re.compile(combined.lower()) if foldable else None
+        self.exclude_re = (
+            re.compile("|".join(f"(?:{_exclude_regex(pattern)})" for pattern in self.exclude_patterns))
+            if self.exclude_patterns
+            else None
+        )
+        # Plain "name/**" patterns, so the source walk can prune those directories by name alone
+        self.exclude_dir_names = frozenset(
+            pattern[:-3]
+            for pattern in self.exclude_patterns
+            if pattern.endswith("/**") and not any(c in pattern[:-3] for c in "*?/")
+        )
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CheckConfig":
         """Create config from dictionary, using defaults for missing values."""
@@ -160,5 +288,12 @@ class CheckConfig:
             enable_prettier=data.get("enable_prettier", True),
             enable_tsc=data.get("enable_tsc", True),
             enable_stub_check=data.get("enable_stub_check", True),
+            parallel=data.get("parallel", True),
+            stub_check_parallel=data.get("stub_check_parallel", True),
+            eslint_concurrency=str(data.get("eslint_concurrency", "auto")),
+            eslint_cache=data.get("eslint_cache", True),
+            eslint_daemon=data.get("eslint_daemon", True),
+            persistent=data.get("persistent", False),
+            result_cache=data.get("result_cache", False),
             exclude_patterns=data.get("exclude_patterns", cls().exclude_patterns),
         )